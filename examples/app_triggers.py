@@ -3,6 +3,11 @@ import os
 
 from voxta_client import VoxtaClient
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and POSIX-only
+    uvloop = None
+
 """
 App Triggers Example
 --------------------
@@ -24,6 +29,12 @@ async def main():
     client = VoxtaClient(os.getenv("VOXTA_URL", "http://localhost:5384"))
     ready = False
 
+    closed = asyncio.Event()
+
+    @client.on("close")
+    def on_close(_):
+        closed.set()
+
     @client.on("ready")
     async def on_ready(session_id):
         nonlocal ready
@@ -41,7 +52,7 @@ async def main():
         print(f"Trigger Received: {name} | Args: {args}")
 
     # Start connection
-    token, cookies = client.negotiate()
+    token, cookies = await client.negotiate_async()
     if not token:
         print("Error: Is Voxta running?")
         return
@@ -49,13 +60,15 @@ async def main():
     await client.connect(token, cookies)
 
     try:
-        while client.running:
-            await asyncio.sleep(0.5)
-    except KeyboardInterrupt:
+        await closed.wait()
+    except (KeyboardInterrupt, asyncio.CancelledError):
         pass
     finally:
         await client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,8 +1,14 @@
 import asyncio
 import os
+import sys
 
 from voxta_client import VoxtaClient
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and POSIX-only
+    uvloop = None
+
 # --- Optional: Enable logs to see SignalR activity ---
 # logging.basicConfig(level=logging.INFO)
 
@@ -12,18 +18,38 @@ async def main():
     client = VoxtaClient(voxta_url)
     started = False
 
+    closed = asyncio.Event()
+
+    @client.on("close")
+    def on_close(_):
+        closed.set()
+
     # Handle character responses (Streaming)
     @client.on("replyStart")
     def on_start(_):
         print("\nAI is thinking... [", end="", flush=True)
 
+    # Chunks arrive once per streamed token, so bind the stdout methods once and
+    # flush at line breaks or every few dozen characters instead of per token
+    write, flush = sys.stdout.write, sys.stdout.flush
+    unflushed = 0
+
     @client.on("replyChunk")
     def on_chunk(data):
-        print(data.get("text", ""), end="", flush=True)
+        nonlocal unflushed
+        text = data.get("text")
+        if text:
+            write(text)
+            unflushed += len(text)
+            if unflushed >= 64 or "\n" in text:
+                flush()
+                unflushed = 0
 
     @client.on("replyEnd")
     def on_end(_):
-        print("] (Done)\n")
+        nonlocal unflushed
+        unflushed = 0
+        print("] (Done)\n", flush=True)
 
     # Wait for the client to be ready (connected and session pinned)
     @client.on("ready")
@@ -41,7 +67,7 @@ async def main():
         await client.send_message(message_text)
 
     # Connection Flow
-    token, cookies = client.negotiate()
+    token, cookies = await client.negotiate_async()
     if not token:
         print("Error: Could not negotiate connection. Is Voxta running?")
         return
@@ -50,14 +76,16 @@ async def main():
     print("Waiting for Voxta to be ready (Ensure a chat is active in the Voxta UI)...")
 
     try:
-        # Keep alive
-        while client.running:
-            await asyncio.sleep(0.5)
-    except KeyboardInterrupt:
+        # Keep alive until the connection closes
+        await closed.wait()
+    except (KeyboardInterrupt, asyncio.CancelledError):
         pass
     finally:
         await client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
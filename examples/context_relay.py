@@ -3,6 +3,11 @@ import os
 
 from voxta_client import VoxtaClient
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and POSIX-only
+    uvloop = None
+
 """
 Context Relay Example
 ---------------------
@@ -20,6 +25,12 @@ async def main():
     client = VoxtaClient(os.getenv("VOXTA_URL", "http://localhost:5384"))
     relayed = False
 
+    closed = asyncio.Event()
+
+    @client.on("close")
+    def on_close(_):
+        closed.set()
+
     @client.on("ready")
     async def on_ready(session_id):
         nonlocal relayed
@@ -38,33 +49,35 @@ async def main():
 
         for update in updates:
             print(f"Relaying background context: {update}")
-            # We send these as 'silent' messages:
-            # - do_reply=False: AI won't generate a response
-            # - do_user_inference=False: Don't check for actions in this message
-            # - do_character_inference=False: Don't check for actions in response
-            await client.send_message(
-                text=f"[MEDIA CONTEXT]: {update}",
-                do_reply=False,
-                do_user_inference=False,
-                do_character_inference=False,
-            )
-            await asyncio.sleep(1)  # Simulate time passing
+
+        # We send these as 'silent' messages, batched into a single frame:
+        # - do_reply=False: AI won't generate a response
+        # - do_user_inference=False: Don't check for actions in these messages
+        # - do_character_inference=False: Don't check for actions in response
+        await client.send_messages(
+            [f"[MEDIA CONTEXT]: {update}" for update in updates],
+            do_reply=False,
+            do_user_inference=False,
+            do_character_inference=False,
+        )
 
         print("\nContext relay complete. The AI now 'knows' what you're watching.")
         print("Try asking it in the Voxta UI: 'What did Neo just say?'")
 
     # Connect to Voxta
-    token, cookies = client.negotiate()
+    token, cookies = await client.negotiate_async()
     if token:
         await client.connect(token, cookies)
         try:
-            while client.running:
-                await asyncio.sleep(0.5)
-        except KeyboardInterrupt:
+            await closed.wait()
+        except (KeyboardInterrupt, asyncio.CancelledError):
             pass
         finally:
             await client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,23 +1,50 @@
+import importlib
 import json
-from unittest.mock import AsyncMock, MagicMock
+import sys
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional
+    uvloop = None
 
-@pytest.fixture
-def mock_websocket():
-    """A mock websocket that simulates SignalR communication."""
-    websocket = AsyncMock()
-    websocket.recv = AsyncMock()
-    websocket.send = AsyncMock()
 
+@dataclass
+class FakeWebSocket:
+    """A typed stand-in for a websockets connection, exposing only what the client uses."""
+
+    recv: AsyncMock = field(default_factory=AsyncMock)
+    send: AsyncMock = field(default_factory=AsyncMock)
+    close: AsyncMock = field(default_factory=AsyncMock)
     # Track messages sent by the client
-    websocket.sent_messages = []
+    sent_messages: list[Any] = field(default_factory=list)
+
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the async tests on uvloop when it is installed."""
+        return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture
+def mock_websocket():
+    """A fake websocket that simulates SignalR communication."""
+    websocket = FakeWebSocket()
 
     async def track_send(msg):
-        # SignalR messages end with \x1e
-        if msg.endswith("\x1e"):
-            websocket.sent_messages.append(json.loads(msg[:-1]))
+        # Fragmented messages arrive as an iterable of str fragments
+        if isinstance(msg, list):
+            msg = "".join(msg)
+        # SignalR messages end with \x1e and several may share one frame
+        if isinstance(msg, str) and msg.endswith("\x1e"):
+            for record in msg.split("\x1e")[:-1]:
+                websocket.sent_messages.append(json.loads(record))
         else:
             websocket.sent_messages.append(msg)
 
@@ -26,6 +53,25 @@ def mock_websocket():
     return websocket
 
 
+@pytest.fixture(params=["installed", "stdlib"])
+def json_shim(request, monkeypatch):
+    """The JSON shim as installed, and as the stdlib fallback used without orjson."""
+    from voxta_client import _json, transport
+
+    if request.param == "installed":
+        yield _json
+        return
+
+    with patch.dict(sys.modules, {"orjson": None}):
+        shim = importlib.reload(_json)
+    monkeypatch.setattr(transport, "loads", shim.loads)
+    monkeypatch.setattr(transport, "DECODE_ERRORS", shim.DECODE_ERRORS)
+    try:
+        yield shim
+    finally:
+        importlib.reload(_json)
+
+
 @pytest.fixture
 def mock_requests():
     """A mock for the requests library used in negotiate."""
@@ -39,5 +85,5 @@ def mock_requests():
         mock_resp.cookies = {"test_cookie": "value"}
 
         mock_post = MagicMock(return_value=mock_resp)
-        mp.setattr("requests.post", mock_post)
+        mp.setattr("requests.Session.post", mock_post)
         yield mock_post
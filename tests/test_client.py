@@ -1,7 +1,9 @@
 import asyncio
 import contextlib
 import json
-from unittest.mock import AsyncMock, patch
+import logging
+import uuid
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
@@ -19,7 +21,14 @@ from tests.mock_data import (
     WELCOME_EVENT,
     wrap_signalr,
 )
-from voxta_client import VoxtaClient
+from voxta_client import VoxtaClient, VoxtaConnectionError
+from voxta_client.client import _encode_cached_message
+from voxta_client.models import (
+    ClientSendMessage,
+    ClientStartChatMessage,
+    ClientSubscribeToChatMessage,
+    ClientUpdateContextMessage,
+)
 
 
 @pytest.mark.asyncio
@@ -32,6 +41,16 @@ async def test_negotiate(mock_requests):
     mock_requests.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_negotiate_async(mock_requests):
+    client = VoxtaClient("http://localhost:5384")
+    token, cookies = await client.negotiate_async()
+
+    assert token == "test_token_123"
+    assert cookies == {"test_cookie": "value"}
+    mock_requests.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_on_event_decorator():
     client = VoxtaClient("http://localhost:5384")
@@ -46,6 +65,96 @@ async def test_on_event_decorator():
     assert received_data == {"key": "value"}
 
 
+@pytest.mark.asyncio
+async def test_on_during_emit_applies_to_next_emit():
+    client = VoxtaClient("http://localhost:5384")
+    calls = []
+
+    def late(data):
+        calls.append(("late", data))
+
+    @client.on("test_event")
+    def register_late(data):
+        calls.append(("first", data))
+        if len(calls) == 1:
+            client.on("test_event", late)
+
+    await client._emit("test_event", 1)
+    assert calls == [("first", 1)]
+
+    await client._emit("test_event", 2)
+    assert calls == [("first", 1), ("first", 2), ("late", 2)]
+
+
+@pytest.mark.asyncio
+async def test_emit_runs_sync_then_async_callbacks():
+    client = VoxtaClient("http://localhost:5384")
+    calls = []
+
+    @client.on("test_event")
+    async def async_cb(data):
+        calls.append(("async", data))
+
+    @client.on("test_event")
+    def sync_cb(data):
+        calls.append(("sync", data))
+
+    await client._emit("test_event", 1)
+    assert calls == [("sync", 1), ("async", 1)]
+
+
+@pytest.mark.asyncio
+async def test_off_unregisters_callbacks():
+    client = VoxtaClient("http://localhost:5384")
+    calls = []
+
+    async def async_cb(data):
+        calls.append(("async", data))
+
+    def sync_cb(data):
+        calls.append(("sync", data))
+
+    for callback in (sync_cb, async_cb, sync_cb):
+        client.on("test_event", callback)
+
+    # Removes one registration at a time; unknown callbacks are ignored
+    client.off("test_event", sync_cb)
+    client.off("test_event", async_cb)
+    client.off("test_event", async_cb)
+    await client._emit("test_event", 1)
+    assert calls == [("sync", 1)]
+
+    client.on("test_event", async_cb)
+    client.off("test_event")
+    await client._emit("test_event", 2)
+    assert calls == [("sync", 1)]
+    assert "test_event" not in client._sync_handlers
+    assert "test_event" not in client._async_handlers
+
+
+@pytest.mark.asyncio
+async def test_emit_runs_async_callbacks_concurrently():
+    client = VoxtaClient("http://localhost:5384")
+    released = asyncio.Event()
+
+    @client.on("test_event")
+    async def waiter(_data):
+        await asyncio.wait_for(released.wait(), timeout=1)
+
+    @client.on("test_event")
+    async def releaser(_data):
+        released.set()
+
+    @client.on("test_event")
+    async def failing(_data):
+        raise ValueError("boom")
+
+    with patch.object(client.logger, "error") as mock_log:
+        await client._emit("test_event", 1)
+    mock_log.assert_called_once_with("Error in callback for %s: %s", "test_event", ANY)
+    assert str(mock_log.call_args[0][2]) == "boom"
+
+
 @pytest.mark.asyncio
 async def test_handle_welcome_updates_state():
     client = VoxtaClient("http://localhost:5384")
@@ -70,6 +179,45 @@ async def test_handle_chat_started_updates_state():
     # chat_id and assistant_id are no longer tracked by the client
 
 
+@pytest.mark.asyncio
+async def test_wait_until_ready():
+    client = VoxtaClient("http://localhost:5384")
+
+    with pytest.raises(asyncio.TimeoutError):
+        await client.wait_until_ready(timeout=0.01)
+
+    waiter = asyncio.create_task(client.wait_until_ready(timeout=1))
+    await asyncio.sleep(0)
+    await client._handle_server_message(wrap_signalr(CHAT_STARTED_EVENT))
+    assert await waiter == CHAT_STARTED_EVENT["sessionId"]
+
+    # Already ready: returns straight away until the connection closes
+    assert await client.wait_until_ready(timeout=0) == CHAT_STARTED_EVENT["sessionId"]
+    client._handle_close()
+    with pytest.raises(asyncio.TimeoutError):
+        await client.wait_until_ready(timeout=0.01)
+
+    # Waiters without a timeout are woken when the connection closes before a session
+    waiter = asyncio.create_task(client.wait_until_ready())
+    await asyncio.sleep(0)
+    client._handle_close()
+    with pytest.raises(VoxtaConnectionError):
+        await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wait_until_ready_wakes_on_failed_connect():
+    client = VoxtaClient("http://localhost:5384")
+    waiter = asyncio.create_task(client.wait_until_ready())
+    await asyncio.sleep(0)
+
+    refused = AsyncMock(side_effect=VoxtaConnectionError("refused"))
+    with patch.object(client.transport, "connect", refused), pytest.raises(VoxtaConnectionError):
+        await client.connect("token")
+    with pytest.raises(VoxtaConnectionError):
+        await asyncio.wait_for(waiter, timeout=1)
+
+
 @pytest.mark.asyncio
 async def test_send_message_payload(mock_websocket):
     client = VoxtaClient("http://localhost:5384")
@@ -88,6 +236,40 @@ async def test_send_message_payload(mock_websocket):
     assert args["sessionId"] == "test_session"
 
 
+@pytest.mark.asyncio
+async def test_send_message_log_truncates_text(mock_websocket, caplog):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "test_session"
+
+    with caplog.at_level(logging.INFO, logger="VoxtaClient"):
+        await client.send_message("x" * 80)
+
+    assert caplog.records[-1].getMessage() == "Sending message to session test_session: " + (
+        "x" * 50 + "..."
+    )
+
+
+@pytest.mark.asyncio
+async def test_send_messages_batches_into_one_frame(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "test_session"
+
+    await client.send_messages(["first", "second", "third"], do_reply=False)
+
+    mock_websocket.send.assert_called_once()
+    texts = [m["arguments"][0]["text"] for m in mock_websocket.sent_messages]
+    assert texts == ["first", "second", "third"]
+    for sent in mock_websocket.sent_messages:
+        args = sent["arguments"][0]
+        assert args["$type"] == "send"
+        assert args["sessionId"] == "test_session"
+        assert args["doReply"] is False
+
+
 @pytest.mark.asyncio
 async def test_read_loop_processing(mock_websocket):
     client = VoxtaClient("http://localhost:5384")
@@ -127,8 +309,6 @@ async def test_connect_flow(mock_websocket):
 
     # Mock websockets.connect context manager
     with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_websocket):
-        # Websocket as async context manager returns itself
-        mock_websocket.__aenter__.return_value = mock_websocket
         # Provide response for SignalR handshake
         mock_websocket.recv.return_value = json.dumps({"type": 0}) + "\x1e"
 
@@ -209,6 +389,41 @@ async def test_action_event_emission():
     assert received_payload == ACTION_EVENT
 
 
+@pytest.mark.asyncio
+async def test_reply_chunk_emitted_without_state_changes():
+    client = VoxtaClient("http://localhost:5384")
+    client.last_message_id = "previous"
+    chunks = []
+    client.on("replyChunk", chunks.append)
+
+    chunk = {"$type": "replyChunk", "messageId": "msg_1", "text": "Hel"}
+    with patch.object(client.logger, "info") as mock_log_info:
+        await client._handle_server_message(wrap_signalr(chunk))
+        mock_log_info.assert_not_called()
+
+    assert chunks == [chunk]
+    assert client.last_message_id == "previous"
+    assert client.is_thinking is False
+
+
+@pytest.mark.asyncio
+async def test_event_logging_gated_on_info_level(caplog):
+    client = VoxtaClient("http://localhost:5384")
+    message = {"$type": "message", "senderType": "User", "text": "Hello" + "!" * 200}
+
+    with caplog.at_level(logging.WARNING, logger="VoxtaClient"):
+        await client._handle_server_message(wrap_signalr(message))
+    assert not caplog.records
+
+    with caplog.at_level(logging.INFO, logger="VoxtaClient"):
+        await client._handle_server_message(wrap_signalr(message))
+        await client._handle_server_message(wrap_signalr(REPLY_GENERATING_EVENT))
+    assert [r.getMessage() for r in caplog.records] == [
+        "Voxta Event: message | From User: Hello" + "!" * 95 + "...",
+        "Voxta Event: replyGenerating",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_reply_generating_state():
     client = VoxtaClient("http://localhost:5384")
@@ -263,7 +478,7 @@ async def test_handle_error_logging():
         await client._handle_server_message(
             wrap_signalr({"$type": "error", "message": "Fatal error"})
         )
-        mock_log.assert_called_with("Voxta Error: Fatal error")
+        mock_log.assert_called_with("Voxta Error: %s", "Fatal error")
 
     with patch.object(client.logger, "info") as mock_log_info:
         # Test specific ignored error
@@ -285,7 +500,7 @@ async def test_emit_callback_exception_handled():
     with patch.object(client.logger, "error") as mock_log:
         await client._emit("test", {})
         mock_log.assert_called()
-        assert "Error in callback for test" in mock_log.call_args[0][0]
+        assert mock_log.call_args[0][:2] == ("Error in callback for %s: %s", "test")
 
 
 @pytest.mark.asyncio
@@ -314,7 +529,7 @@ async def test_handle_signalr_completion_error():
 
     with patch.object(client.logger, "error") as mock_log:
         await client._handle_server_message(completion_msg)
-        mock_log.assert_called_with("Invocation 123 failed: Method not found")
+        mock_log.assert_called_with("Invocation %s failed: %s", "123", "Method not found")
         assert error_data["error"] == "Method not found"
 
 
@@ -367,6 +582,25 @@ async def test_handle_chats_sessions_updated(mock_websocket):
     assert sent_subscribe is not None
 
 
+@pytest.mark.asyncio
+async def test_sessions_updated_keeps_pinned_chat(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client._active_chat_id = "chat_b"
+
+    sessions = [
+        {"chatId": "chat_a", "sessionId": "session_a"},
+        {"chatId": "chat_b", "sessionId": "session_b"},
+    ]
+    await client._handle_server_message(
+        wrap_signalr({"$type": "chatsSessionsUpdated", "sessions": sessions})
+    )
+
+    assert client.session_id == "session_b"
+    assert client._active_chat_id == "chat_b"
+
+
 @pytest.mark.asyncio
 async def test_character_speech_request_payload(mock_websocket):
     client = VoxtaClient("http://localhost:5384")
@@ -446,6 +680,36 @@ async def test_pause_payload(mock_websocket):
     args = sent["arguments"][0]
     assert args["$type"] == "pauseChat"
     assert args["sessionId"] == "test_session"
+    assert args["pause"] is True
+
+    await client.pause(pause=False)
+    assert mock_websocket.sent_messages[-1]["arguments"][0]["pause"] is False
+
+
+@pytest.mark.asyncio
+async def test_use_session_override(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    other = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "active"
+
+    with client.use_session("scoped"), other.use_session("ignored"):
+        await client.revert()
+        assert mock_websocket.sent_messages[-1]["arguments"][0]["sessionId"] == "scoped"
+        # Positional and explicit session IDs win over the override
+        await client.pause("explicit", False)
+        args = mock_websocket.sent_messages[-1]["arguments"][0]
+        assert args["sessionId"] == "explicit"
+        assert args["pause"] is False
+
+    await client.revert()
+    assert mock_websocket.sent_messages[-1]["arguments"][0]["sessionId"] == "active"
+
+    client.session_id = None
+    count = len(mock_websocket.sent_messages)
+    await client.retry()
+    assert len(mock_websocket.sent_messages) == count
 
 
 @pytest.mark.asyncio
@@ -491,6 +755,26 @@ async def test_start_chat_payload(mock_websocket):
     assert args["contexts"] == [{"key": "val"}]
 
 
+@pytest.mark.asyncio
+async def test_direct_payloads_match_models(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+
+    await client.start_chat(character_id="char_123")
+    await client.subscribe_to_chat("sess_1", "chat_1")
+    await client.update_context("sess_1", "ctx", actions=[{"name": "wave"}])
+
+    sent = [m["arguments"][0] for m in mock_websocket.sent_messages[-3:]]
+    assert sent == [
+        ClientStartChatMessage(characterId="char_123").to_dict(),
+        ClientSubscribeToChatMessage(sessionId="sess_1", chatId="chat_1").to_dict(),
+        ClientUpdateContextMessage(
+            sessionId="sess_1", contextKey="ctx", actions=[{"name": "wave"}]
+        ).to_dict(),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_trigger_action_payload(mock_websocket):
     client = VoxtaClient("http://localhost:5384")
@@ -505,7 +789,25 @@ async def test_trigger_action_payload(mock_websocket):
     assert args["$type"] == "triggerAction"
     assert args["sessionId"] == "test_session"
     assert args["value"] == "triggerReply"
-    assert "messageId" in args
+    message_id = uuid.UUID(args["messageId"])
+    assert message_id.version == 7
+
+    await client.trigger_action(action="triggerReply")
+    next_id = uuid.UUID(mock_websocket.sent_messages[-1]["arguments"][0]["messageId"])
+    assert next_id > message_id
+
+
+@pytest.mark.asyncio
+async def test_trigger_action_non_str_argument_keys(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "test_session"
+
+    await client.trigger_action(action="pick", arguments={1: "first", "two": 2})
+
+    args = mock_websocket.sent_messages[-1]["arguments"][0]
+    assert args["arguments"] == {"1": "first", "two": 2}
 
 
 @pytest.mark.asyncio
@@ -569,6 +871,74 @@ async def test_typing_end_payload(mock_websocket):
     assert args["sent"] is True
 
 
+@pytest.mark.asyncio
+async def test_session_message_emits_client_send(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "test_session"
+
+    emitted = []
+    client.on("client_send", emitted.append)
+
+    await client.interrupt()
+    await client.interrupt()
+
+    assert [m["$type"] for m in emitted] == ["interrupt", "interrupt"]
+    sent = mock_websocket.sent_messages[-2:]
+    assert [m["invocationId"] for m in sent] == [m["invocationId"] for m in emitted]
+    assert sent[0]["invocationId"] != sent[1]["invocationId"]
+    assert sent[1]["arguments"] == [{"$type": "interrupt", "sessionId": "test_session"}]
+
+
+@pytest.mark.asyncio
+async def test_client_message_uses_invocation_template(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "test_session"
+
+    emitted = []
+    client.on("client_send", emitted.append)
+
+    await client.send_message("Hi")
+
+    sent = mock_websocket.sent_messages[-1]
+    assert sent["type"] == 1
+    assert sent["target"] == "SendMessage"
+    assert sent["invocationId"] == emitted[0]["invocationId"]
+    assert sent["arguments"][0]["text"] == "Hi"
+    assert "invocationId" not in sent["arguments"][0]
+
+
+@pytest.mark.asyncio
+async def test_invocation_ids_count_up_per_connection(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "test_session"
+
+    await client.interrupt()
+    await client.send_message("Hi")
+
+    first, second = (m["invocationId"] for m in mock_websocket.sent_messages[-2:])
+    prefix = client._invocation_prefix
+    assert (first, second) == (f"{prefix}-0", f"{prefix}-1")
+
+
+@pytest.mark.asyncio
+async def test_random_invocation_ids(mock_websocket):
+    client = VoxtaClient("http://localhost:5384", random_invocation_ids=True)
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+    client.session_id = "test_session"
+
+    await client.interrupt()
+
+    invocation_id = mock_websocket.sent_messages[-1]["invocationId"]
+    assert str(uuid.UUID(invocation_id)) == invocation_id
+
+
 @pytest.mark.asyncio
 async def test_load_characters_list_payload(mock_websocket):
     client = VoxtaClient("http://localhost:5384")
@@ -582,6 +952,23 @@ async def test_load_characters_list_payload(mock_websocket):
     assert args["$type"] == "loadCharactersList"
 
 
+@pytest.mark.asyncio
+async def test_field_less_messages_reuse_encoding(mock_websocket):
+    client = VoxtaClient("http://localhost:5384")
+    client.transport.websocket = mock_websocket
+    client.transport.running = True
+
+    _encode_cached_message.cache_clear()
+    await client.authenticate("token")
+    await client.authenticate("token")
+
+    assert _encode_cached_message.cache_info().hits == 1
+    first, second = mock_websocket.sent_messages[-2:]
+    assert first["arguments"] == second["arguments"]
+    assert first["arguments"][0]["$type"] == "authenticate"
+    assert first["invocationId"] != second["invocationId"]
+
+
 @pytest.mark.asyncio
 async def test_load_scenarios_list_payload(mock_websocket):
     client = VoxtaClient("http://localhost:5384")
@@ -700,3 +1087,160 @@ def test_model_to_dict_order():
     keys = list(d.keys())
     assert keys[0] == "$type"
     assert d["$type"] == "send"
+
+
+def test_model_to_dict_specialized_per_class():
+    from voxta_client.models import ClientMessage, ClientSendMessage, ClientTriggerActionMessage
+
+    action = ClientTriggerActionMessage(sessionId="s", messageId="m", value="v")
+    assert action.to_dict() == {
+        "$type": "triggerAction",
+        "sessionId": "s",
+        "messageId": "m",
+        "value": "v",
+    }
+    action.arguments = {"a": 1}
+    assert action.to_dict()["arguments"] == {"a": 1}
+
+    # Each class compiles its own encoder, so siblings and the base stay independent
+    assert ClientSendMessage(sessionId="s", text="t").to_dict()["text"] == "t"
+    assert ClientTriggerActionMessage.to_dict is not ClientSendMessage.to_dict
+    assert ClientMessage().to_dict() == {}
+
+
+def test_model_to_dict_compiles_once_for_early_bound_method():
+    from dataclasses import dataclass
+
+    from voxta_client import models
+
+    @dataclass
+    class Probe(models.VoxtaModel):
+        name: str = "n"
+
+    # Bound before the first call, so every call goes through the bootstrap
+    to_dict = Probe().to_dict
+    with patch.object(models, "_compile_to_dict", wraps=models._compile_to_dict) as compile_:
+        assert to_dict() == {"name": "n"}
+        assert to_dict() == {"name": "n"}
+    assert compile_.call_count == 1
+
+
+def test_model_from_dict_compiles_once_for_early_reference():
+    from dataclasses import dataclass
+
+    from voxta_client import models
+
+    @dataclass
+    class Probe(models.VoxtaModel):
+        name: str = "n"
+
+    from_dict = Probe._from_dict
+    with patch.object(models, "_compile_from_dict", wraps=models._compile_from_dict) as compile_:
+        assert from_dict({"name": "a"}).name == "a"
+        assert from_dict({"name": "b"}).name == "b"
+    assert compile_.call_count == 1
+
+
+def test_model_to_dict_omits_none_fields():
+    from voxta_client.models import ClientCharacterSpeechRequestMessage, ClientUpdateContextMessage
+
+    msg = ClientUpdateContextMessage(sessionId="s", contextKey="k", setFlags=["f"])
+    assert msg.to_dict() == {
+        "$type": "updateContext",
+        "sessionId": "s",
+        "contextKey": "k",
+        "setFlags": ["f"],
+    }
+    # None is omitted for every field, including ones not annotated Optional
+    msg.contextKey = None
+    assert "contextKey" not in msg.to_dict()
+    request = ClientCharacterSpeechRequestMessage(sessionId="s", characterId="c", text=None)
+    assert "text" not in request.to_dict()
+
+
+def test_model_to_signalr_record():
+    from voxta_client.models import ClientSendMessage
+
+    msg = ClientSendMessage(sessionId="s", text="héllo")
+    record = msg.to_signalr_record("inv-1")
+    assert json.loads(record) == msg.to_signalr_invocation("inv-1")
+
+    record = msg.to_signalr_record('in"v\\1')
+    assert json.loads(record) == msg.to_signalr_invocation('in"v\\1')
+
+
+@pytest.mark.asyncio
+async def test_handle_close_tracks_emit_task():
+    client = VoxtaClient("http://localhost:5384")
+    closed = asyncio.Event()
+    client.on("close", lambda _data: closed.set())
+
+    client._handle_close()
+    assert len(client._pending_tasks) == 1
+
+    await asyncio.wait_for(closed.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert not client._pending_tasks
+
+
+@pytest.mark.asyncio
+async def test_handle_close_from_another_thread():
+    client = VoxtaClient("http://localhost:5384")
+    client._loop = asyncio.get_running_loop()
+    closed = asyncio.Event()
+    client.on("close", lambda _data: closed.set())
+
+    waiter = asyncio.create_task(client.wait_until_ready())
+    await asyncio.sleep(0)
+    await asyncio.to_thread(client._handle_close)
+    await asyncio.wait_for(closed.wait(), timeout=1)
+    with pytest.raises(VoxtaConnectionError):
+        await asyncio.wait_for(waiter, timeout=1)
+
+
+def test_parse_server_message():
+    from voxta_client import VoxtaProtocolError, parse_server_message
+    from voxta_client.models import (
+        CLIENT_MESSAGE_TYPES,
+        SERVER_MESSAGE_TYPES,
+        ServerActionMessage,
+        ServerWelcomeMessage,
+    )
+
+    assert SERVER_MESSAGE_TYPES["action"] is ServerActionMessage
+    assert CLIENT_MESSAGE_TYPES["send"] is ClientSendMessage
+
+    action = parse_server_message(ACTION_EVENT)
+    assert isinstance(action, ServerActionMessage)
+    assert action.value == "play_neutral_emote"
+    assert action.layer == "emotes"
+    assert action.arguments is None
+
+    welcome = parse_server_message(WELCOME_EVENT)
+    assert isinstance(welcome, ServerWelcomeMessage)
+    assert welcome.user["name"] == "User"
+
+    assert parse_server_message({"$type": "notAModel"}) is None
+    with pytest.raises(VoxtaProtocolError, match="action"):
+        parse_server_message({"$type": "action", "value": "x"})
+
+
+def test_model_from_dict_matches_init():
+    from voxta_client.models import ClientAuthenticateMessage, ServerChatMessage
+
+    data = {
+        "messageId": "m",
+        "senderId": "s",
+        "text": "t",
+        "role": "Assistant",
+        "timestamp": "now",
+        "sessionId": "sess",
+    }
+    built = ServerChatMessage._from_dict({"$type": "message", "extra": 1, **data})
+    assert built == ServerChatMessage(**data)
+    assert built.to_dict() == ServerChatMessage(**data).to_dict()
+
+    # default_factory fields get a fresh value per instance
+    first = ClientAuthenticateMessage._from_dict({})
+    assert first == ClientAuthenticateMessage()
+    assert first.scope is not ClientAuthenticateMessage._from_dict({}).scope
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -5,6 +6,7 @@ import pytest
 import websockets
 
 from voxta_client import VoxtaClient
+from voxta_client._json import dumps
 from voxta_client.audio_client import VoxtaAudioClient
 from voxta_client.exceptions import VoxtaConnectionError
 from voxta_client.transport import VoxtaTransport
@@ -15,7 +17,7 @@ async def test_transport_negotiate_errors():
     transport = VoxtaTransport("http://localhost:5384")
 
     # Test 404 response
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.return_value.status_code = 404
         mock_post.return_value.text = "Not Found"
         token, cookies = transport.negotiate()
@@ -23,7 +25,7 @@ async def test_transport_negotiate_errors():
         assert cookies is None
 
     # Test exception
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.side_effect = Exception("Network down")
         token, cookies = transport.negotiate()
         assert token is None
@@ -41,12 +43,31 @@ async def test_transport_connect_error():
     assert transport.running is False
 
 
+@pytest.mark.asyncio
+async def test_websocket_url_only_rewrites_scheme(mock_websocket):
+    transport = VoxtaTransport("https://myhttphost:5384")
+    audio = VoxtaAudioClient("http://myhttphost:5384")
+
+    with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_websocket) as conn:
+        with patch.object(transport, "_read_loop", new_callable=AsyncMock):
+            await transport.connect("a b", cookies={"x": "1", "y": "2"})
+        assert conn.call_args[0][0] == "wss://myhttphost:5384/hub?id=a%20b"
+        assert conn.call_args[1]["additional_headers"] == {"Cookie": "x=1; y=2"}
+
+        with patch.object(audio, "_read_loop", new_callable=AsyncMock):
+            await audio.connect("token")
+        assert conn.call_args[0][0] == "ws://myhttphost:5384/hub?id=token"
+
+
 @pytest.mark.asyncio
 async def test_transport_send_not_connected():
     transport = VoxtaTransport("http://localhost:5384")
-    # Should just log a warning and return
-    await transport.send({"test": "data"})
-    assert transport.websocket is None
+    with pytest.raises(VoxtaConnectionError):
+        await transport.send({"test": "data"})
+    with pytest.raises(VoxtaConnectionError):
+        await transport.send_records(["{}"])
+    # An empty batch has nothing to send
+    await transport.send_records([])
 
 
 @pytest.mark.asyncio
@@ -56,10 +77,204 @@ async def test_transport_send_exception(mock_websocket):
     transport.running = True
 
     mock_websocket.send.side_effect = Exception("Send failed")
-    await transport.send({"test": "data"})
+    with pytest.raises(VoxtaConnectionError, match="Send failed"):
+        await transport.send({"test": "data"})
     assert transport.running is False
 
 
+@pytest.mark.asyncio
+async def test_transport_send_many_fragments_large_batches(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    small = [{"n": i} for i in range(3)]
+    await transport.send_many(small)
+    assert isinstance(mock_websocket.send.call_args[0][0], str)
+
+    large = [{"n": i, "text": "x" * 1024} for i in range(100)]
+    await transport.send_many(large)
+    fragments = mock_websocket.send.call_args[0][0]
+    assert isinstance(fragments, list)
+    assert all(fragment.endswith("\x1e") for fragment in fragments)
+    assert mock_websocket.sent_messages == small + large
+
+    # Many small records are grouped into fragments of up to 64 KiB, not one each
+    many = [{"n": i, "text": "x" * 90} for i in range(1000)]
+    await transport.send_many(many)
+    fragments = mock_websocket.send.call_args[0][0]
+    assert len(fragments) == 2
+    assert all(len(fragment) <= 64 * 1024 for fragment in fragments)
+    assert mock_websocket.sent_messages == small + large + many
+
+
+@pytest.mark.asyncio
+async def test_transport_coalesces_sends_during_inflight_write(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    frames = []
+    gate = asyncio.Event()
+
+    async def slow_send(msg):
+        frames.append(msg)
+        if len(frames) == 1:
+            await gate.wait()
+
+    mock_websocket.send.side_effect = slow_send
+
+    first = asyncio.create_task(transport.send({"n": 0}))
+    await asyncio.sleep(0)
+    queued = [asyncio.create_task(transport.send({"n": n})) for n in (1, 2)]
+    await asyncio.sleep(0)
+    assert len(frames) == 1
+    # Queued sends wait for the in-flight writer to flush them
+    assert not any(task.done() for task in queued)
+
+    gate.set()
+    await asyncio.gather(first, *queued)
+    records = [dumps({"n": i}) + "\x1e" for i in range(3)]
+    assert frames == [records[0], records[1] + records[2]]
+    assert not transport._outbox
+
+
+@pytest.mark.asyncio
+async def test_transport_queued_sends_see_write_failure(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    gate = asyncio.Event()
+
+    async def failing_send(_msg):
+        await gate.wait()
+        raise ConnectionError("peer gone")
+
+    mock_websocket.send.side_effect = failing_send
+
+    first = asyncio.create_task(transport.send({"n": 0}))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(transport.send({"n": 1}))
+    await asyncio.sleep(0)
+
+    gate.set()
+    # The writer and the sends queued behind it see the same failure
+    with pytest.raises(VoxtaConnectionError, match="peer gone"):
+        await first
+    with pytest.raises(VoxtaConnectionError, match="peer gone"):
+        await queued
+    assert not transport.running
+    assert not transport._outbox
+
+
+@pytest.mark.asyncio
+async def test_transport_cancelled_write_fails_queued_sends(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    gate = asyncio.Event()
+
+    async def stalled_send(_msg):
+        await gate.wait()
+
+    mock_websocket.send.side_effect = stalled_send
+
+    first = asyncio.create_task(transport.send({"n": 0}))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(transport.send({"n": 1}))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    # The queued record was never written, so its caller must not see success
+    with pytest.raises(VoxtaConnectionError, match="cancelled"):
+        await queued
+    assert not transport._outbox
+    assert transport._flush_done is None
+    assert mock_websocket.send.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_transport_close_flushes_queued_sends(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    events = []
+    gate = asyncio.Event()
+
+    async def slow_send(msg):
+        events.append(("send", msg))
+        if len(events) == 1:
+            await gate.wait()
+
+    mock_websocket.send.side_effect = slow_send
+    mock_websocket.close.side_effect = lambda: events.append(("close", None))
+
+    first = asyncio.create_task(transport.send({"n": 0}))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(transport.send({"n": 1}))
+    await asyncio.sleep(0)
+    closing = asyncio.create_task(transport.close())
+    await asyncio.sleep(0)
+    mock_websocket.close.assert_not_called()
+
+    gate.set()
+    await asyncio.gather(first, queued, closing)
+    assert [kind for kind, _ in events] == ["send", "send", "close"]
+    assert events[1][1] == dumps({"n": 1}) + "\x1e"
+
+
+@pytest.mark.asyncio
+async def test_transport_cancelled_close_leaves_writer_intact(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    gate = asyncio.Event()
+
+    async def slow_send(_msg):
+        await gate.wait()
+
+    mock_websocket.send.side_effect = slow_send
+
+    first = asyncio.create_task(transport.send({"n": 0}))
+    await asyncio.sleep(0)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(transport.close(), 0.01)
+
+    # The in-flight send still completes cleanly
+    gate.set()
+    await first
+
+
+@pytest.mark.asyncio
+async def test_transport_close_does_not_wait_forever_on_stalled_write(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    stalled = asyncio.Event()
+
+    async def stalled_send(_msg):
+        await stalled.wait()
+
+    mock_websocket.send.side_effect = stalled_send
+    # Closing the socket is what unblocks a write the peer stopped reading
+    mock_websocket.close.side_effect = stalled.set
+
+    first = asyncio.create_task(transport.send({"n": 0}))
+    await asyncio.sleep(0)
+    with patch("voxta_client.transport._CLOSE_FLUSH_TIMEOUT", 0.01):
+        await asyncio.wait_for(transport.close(), 1)
+
+    mock_websocket.close.assert_called_once()
+    await first
+
+
 @pytest.mark.asyncio
 async def test_transport_read_loop_sync_callback(mock_websocket):
     transport = VoxtaTransport("http://localhost:5384")
@@ -81,16 +296,98 @@ async def test_transport_read_loop_sync_callback(mock_websocket):
 
 
 @pytest.mark.asyncio
+async def test_transport_read_loop_split_record(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    received = []
+    transport.set_callbacks(on_message=received.append)
+
+    # One record split across two frames, followed by a complete one in the second frame
+    record = json.dumps({"type": 1, "target": "ReceiveMessage"})
+    mock_websocket.recv.side_effect = [
+        record[:10],
+        record[10:] + "\x1e" + json.dumps({"type": 3}) + "\x1e",
+        Exception("Stop"),
+    ]
+    await transport._read_loop()
+
+    assert received == [{"type": 1, "target": "ReceiveMessage"}, {"type": 3}]
+
+
+@pytest.mark.asyncio
+async def test_transport_read_loop_skips_pings(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    received = []
+    transport.set_callbacks(on_message=received.append)
+
+    mock_websocket.recv.side_effect = [
+        '{"type":6}\x1e \r\n\x1e',
+        b'{"type":6}\x1e{"type":1}\x1e\n\x1e',
+        Exception("Stop"),
+    ]
+    loads_patch = patch("voxta_client.transport.loads", wraps=json.loads)
+    with loads_patch as mock_loads, patch.object(transport.logger, "error") as mock_log:
+        await transport._read_loop()
+
+    assert received == [{"type": 1}]
+    mock_loads.assert_called_once()
+    # Whitespace-only records are skipped, not reported as decode errors
+    assert all("decode" not in call.args[0] for call in mock_log.call_args_list)
+
+
+def test_transport_discards_oversized_partial_record():
+    transport = VoxtaTransport("http://localhost:5384")
+
+    with patch("voxta_client.transport._MAX_PENDING_RECORD", 8):
+        assert transport._split_records('{"type":6}\x1e{"type":1,"target":') == ['{"type":6}']
+        assert transport._pending == ""
+
+        assert transport._split_records('{"type"') == []
+        assert transport._pending == '{"type"'
+
+
+@pytest.mark.asyncio
+async def test_transport_read_loop_binary_frame(mock_websocket):
+    transport = VoxtaTransport("http://localhost:5384")
+    transport.websocket = mock_websocket
+    transport.running = True
+
+    received = []
+    transport.set_callbacks(on_message=received.append)
+
+    mock_websocket.recv.side_effect = [b'{"type":1}\x1e{"type":3}\x1e', Exception("Stop")]
+    await transport._read_loop()
+
+    assert received == [{"type": 1}, {"type": 3}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("json_shim")
 async def test_transport_read_loop_json_error(mock_websocket):
     transport = VoxtaTransport("http://localhost:5384")
     transport.websocket = mock_websocket
     transport.running = True
 
     # Invalid JSON followed by something that stops the loop
-    mock_websocket.recv.side_effect = ["invalid json\x1e", Exception("Stop")]
+    mock_websocket.recv.side_effect = [
+        "invalid json\x1e",
+        b"\xff" * 300 + b"\x1e",
+        Exception("Stop"),
+    ]
 
-    await transport._read_loop()
-    # Should not crash, just log error
+    with patch.object(transport.logger, "error") as mock_log:
+        await transport._read_loop()
+    # Should not crash, just log error with a bounded preview of the record
+    text_call, bytes_call = mock_log.call_args_list[:2]
+    assert text_call.args[1:3] == (12, "invalid json")
+    assert bytes_call.args[1:3] == (300, b"\xff" * 200)
+    # Both records were handled individually; the loop only stopped on the final error
+    assert mock_log.call_args_list[2].args[0] == "Error in transport read loop: %s"
 
 
 @pytest.mark.asyncio
@@ -105,7 +402,6 @@ async def test_audio_client_basic_flow(mock_websocket):
     client = VoxtaAudioClient("http://localhost:5384")
 
     with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_websocket):
-        mock_websocket.__aenter__.return_value = mock_websocket
         mock_websocket.recv.return_value = json.dumps({"type": 0}) + "\x1e"
 
         # Mock _read_loop to avoid background task hanging
@@ -124,6 +420,20 @@ async def test_audio_client_basic_flow(mock_websocket):
             mock_websocket.close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_audio_client_send_reused_buffer(mock_websocket):
+    client = VoxtaAudioClient("http://localhost:5384")
+    client.websocket = mock_websocket
+    client.running = True
+
+    frame = bytearray(b"\x00\x01" * 4)
+    view = memoryview(frame)[:6]
+    await client.send_audio(view)
+
+    mock_websocket.send.assert_called_once_with(view)
+    assert client.running is True
+
+
 @pytest.mark.asyncio
 async def test_audio_client_connect_failure():
     client = VoxtaAudioClient("http://localhost:5384")
@@ -156,6 +466,22 @@ async def test_audio_client_read_loop(mock_websocket):
     assert received_audio == [b"rawpcm"]
 
 
+def test_pcm16_to_float32():
+    np = pytest.importorskip("numpy")
+    from voxta_client.audio_client import pcm16_to_float32
+
+    pcm = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+    samples = pcm16_to_float32(pcm)
+    assert samples.dtype == np.float32
+    assert samples.tolist() == [0.0, 0.5, -1.0, 32767 / 32768]
+
+    # A preallocated buffer is reused and trimmed to the frame length
+    buffer = np.zeros(8, dtype=np.float32)
+    view = pcm16_to_float32(pcm[:4], out=buffer)
+    assert view.base is buffer
+    assert buffer[:2].tolist() == [0.0, 0.5]
+
+
 @pytest.mark.asyncio
 async def test_audio_client_read_loop_text_data(mock_websocket):
     client = VoxtaAudioClient("http://localhost:5384")
@@ -216,20 +542,19 @@ async def test_client_all_event_types():
 async def test_audio_client_with_cookies(mock_websocket):
     client = VoxtaAudioClient("http://localhost:5384")
     with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_websocket):
-        mock_websocket.__aenter__.return_value = mock_websocket
         mock_websocket.recv.return_value = json.dumps({"type": 0}) + "\x1e"
         with patch.object(client, "_read_loop", new_callable=AsyncMock):
             await client.connect("test_token", cookies={"auth": "secret"})
             # Verify cookie header was built
             args, kwargs = websockets.connect.call_args
             assert kwargs["additional_headers"]["Cookie"] == "auth=secret"
+            assert kwargs["compression"] is None
 
 
 @pytest.mark.asyncio
 async def test_transport_with_cookies(mock_websocket):
     transport = VoxtaTransport("http://localhost:5384")
     with patch("websockets.connect", new_callable=AsyncMock, return_value=mock_websocket):
-        mock_websocket.__aenter__.return_value = mock_websocket
         mock_websocket.recv.return_value = json.dumps({"type": 0}) + "\x1e"
         with patch.object(transport, "_read_loop", new_callable=AsyncMock):
             await transport.connect("test_token", cookies={"auth": "secret"})
@@ -244,7 +569,10 @@ async def test_client_missing_session_id():
     client.session_id = None
 
     # These should all return early without calling transport.send
-    with patch.object(client.transport, "send", new_callable=AsyncMock) as mock_send:
+    with (
+        patch.object(client.transport, "send", new_callable=AsyncMock) as mock_send,
+        patch.object(client.transport, "send_record", new_callable=AsyncMock) as mock_record,
+    ):
         await client.trigger_action("act")
         await client.revert()
         await client.retry()
@@ -263,6 +591,7 @@ async def test_client_missing_session_id():
         await client.pause()
 
         mock_send.assert_not_called()
+        mock_record.assert_not_called()
 
 
 @pytest.mark.asyncio
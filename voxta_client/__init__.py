@@ -17,6 +17,7 @@ from voxta_client.models import (
     ServerChatMessage,
     ServerMessage,
     ServerWelcomeMessage,
+    parse_server_message,
 )
 
 __all__ = [
@@ -37,4 +38,5 @@ __all__ = [
     "ClientUpdateContextMessage",
     "ClientRegisterAppMessage",
     "ClientAuthenticateMessage",
+    "parse_server_message",
 ]
@@ -0,0 +1,38 @@
+"""
+JSON helpers for the SignalR hot path.
+
+Uses orjson when it is installed (``pip install voxta-client[speedups]``) and
+falls back to the standard library otherwise. The implementation is chosen once
+at import time so the per-message calls carry no extra branching.
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed extras
+    orjson = None
+
+loads: Callable[[Any], Any]
+dumps: Callable[[Any], str]
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> str:
+        # SignalR's JSON protocol uses text frames, so hand websockets a str. Non-str
+        # keys (e.g. ints in user-supplied action arguments) are stringified like the
+        # stdlib encoder does instead of raising.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+else:  # pragma: no cover - depends on the installed extras
+    loads = json.loads
+    # One preconfigured encoder matching orjson's compact UTF-8 output; skipping the
+    # circular-reference check is safe because payloads are plain message dicts.
+    dumps = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":")).encode
+
+# Errors raised for a record that isn't valid JSON. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError; the stdlib decoder raises UnicodeDecodeError instead for a
+# binary record that isn't valid UTF-8.
+DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
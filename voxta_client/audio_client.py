@@ -1,11 +1,37 @@
 import asyncio
-import json
 import logging
+import urllib.parse
 import uuid
-from typing import Callable, Optional
+from typing import Any, Callable, Optional, Union
 
 import websockets
 
+from voxta_client._json import dumps
+
+
+def pcm16_to_float32(pcm_data: Union[bytes, bytearray, memoryview], out: Any = None) -> Any:
+    """
+    Convert 16-bit signed PCM audio to float32 samples in the range [-1.0, 1.0).
+
+    Requires NumPy (``pip install "voxta-client[audio]"``). The conversion is a single
+    vectorized pass over a zero-copy view of the input, so it suits being called from
+    an ``on_audio`` callback for every received frame.
+
+    Args:
+        pcm_data: Little-endian 16-bit PCM data, as delivered to ``on_audio`` callbacks.
+        out: Optional preallocated float32 array to write into, reused across frames.
+            Must hold at least one element per sample.
+
+    Returns:
+        A float32 NumPy array with one element per sample.
+    """
+    import numpy as np
+
+    samples = np.frombuffer(pcm_data, dtype="<i2")
+    out = np.empty(samples.size, dtype=np.float32) if out is None else out[: samples.size]
+    np.multiply(samples, np.float32(1.0 / 32768.0), out=out)
+    return out
+
 
 class VoxtaAudioClient:
     """
@@ -21,6 +47,8 @@ class VoxtaAudioClient:
             logger: Optional logger instance.
         """
         self.url = url
+        # Only the scheme prefix is rewritten (http -> ws, https -> wss)
+        self._ws_base = url.replace("http", "ws", 1) + "/hub"
         self.logger = logger or logging.getLogger("VoxtaAudioClient")
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.running = False
@@ -34,25 +62,23 @@ class VoxtaAudioClient:
             connection_token: The SignalR connection token obtained from negotiation.
             cookies: Optional cookies to include in the connection request.
         """
-        import urllib.parse
-
-        ws_url = self.url.replace("http", "ws").replace("https", "wss")
-        encoded_token = urllib.parse.quote(connection_token)
-        full_ws_url = f"{ws_url}/hub?id={encoded_token}"
+        full_ws_url = f"{self._ws_base}?id={urllib.parse.quote(connection_token)}"
 
         extra_headers = {}
         if cookies:
-            cookie_header = "; ".join([f"{k}={v}" for k, v in cookies.items()])
-            extra_headers["Cookie"] = cookie_header
+            extra_headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
 
-        self.logger.info(f"Connecting to audio client: {full_ws_url}")
+        self.logger.info("Connecting to audio client: %s", full_ws_url)
         try:
-            self.websocket = await websockets.connect(full_ws_url, additional_headers=extra_headers)
+            # Raw PCM barely compresses, so skip permessage-deflate on this socket
+            self.websocket = await websockets.connect(
+                full_ws_url, additional_headers=extra_headers, compression=None
+            )
 
             # 1. SignalR Handshake
-            await self.websocket.send(json.dumps({"protocol": "json", "version": 1}) + "\x1e")
+            await self.websocket.send(dumps({"protocol": "json", "version": 1}) + "\x1e")
             handshake_resp = await self.websocket.recv()
-            self.logger.info(f"Audio client handshake complete: {handshake_resp}")
+            self.logger.info("Audio client handshake complete: %s", handshake_resp)
 
             # 2. Authenticate with audio capabilities
             # This specific connection is for audio streaming
@@ -74,14 +100,14 @@ class VoxtaAudioClient:
                     }
                 ],
             }
-            await self.websocket.send(json.dumps(auth_msg) + "\x1e")
+            await self.websocket.send(dumps(auth_msg) + "\x1e")
             self.logger.info("Audio client authentication sent")
 
             self.running = True
             asyncio.create_task(self._read_loop())
         except Exception as e:
             self.running = False
-            self.logger.error(f"Failed to connect to audio client: {e}")
+            self.logger.error("Failed to connect to audio client: %s", e)
             raise
 
     def on_audio(self, callback: Callable[[bytes], None]):
@@ -93,10 +119,14 @@ class VoxtaAudioClient:
         """
         self._on_audio_data = callback
 
-    async def send_audio(self, pcm_data: bytes):
+    async def send_audio(self, pcm_data: Union[bytes, bytearray, memoryview]):
         """
         Send binary PCM data to the server.
 
+        Any bytes-like object is sent as-is, without an intermediate ``bytes()``
+        copy. The frame is serialized before this call returns, so a capture
+        callback can refill the same ``bytearray`` for every frame.
+
         Args:
             pcm_data: Binary PCM audio data.
         """
@@ -104,7 +134,7 @@ class VoxtaAudioClient:
             try:
                 await self.websocket.send(pcm_data)
             except Exception as e:
-                self.logger.error(f"Failed to send audio data: {e}")
+                self.logger.error("Failed to send audio data: %s", e)
                 self.running = False
 
     async def _read_loop(self):
@@ -118,11 +148,11 @@ class VoxtaAudioClient:
                     if self._on_audio_data:
                         self._on_audio_data(data)
                 else:
-                    self.logger.debug(f"Received non-binary data on audio stream: {data}")
+                    self.logger.debug("Received non-binary data on audio stream: %s", data)
         except websockets.ConnectionClosed:
             self.logger.info("Audio stream closed")
         except Exception as e:
-            self.logger.error(f"Error in audio stream read loop: {e}")
+            self.logger.error("Error in audio stream read loop: %s", e)
         finally:
             self.running = False
 
@@ -1,9 +1,19 @@
 import asyncio
+import contextlib
+import functools
+import inspect
+import itertools
 import logging
+import os
+import time
 import uuid
+from collections.abc import Awaitable, Iterator
+from contextvars import ContextVar
 from typing import Any, Callable, Optional
 
+from voxta_client._json import dumps
 from voxta_client.constants import EventType
+from voxta_client.exceptions import VoxtaConnectionError
 from voxta_client.models import (
     ClientAddChatParticipantMessage,
     ClientAuthenticateMessage,
@@ -34,29 +44,124 @@ from voxta_client.models import (
     ClientTypingStartMessage,
     ClientUpdateContextMessage,
     ClientUpdateMessageMessage,
+    _invocation_record,
 )
 from voxta_client.transport import VoxtaTransport
 
+# Per-event behaviour flags, looked up once per inbound event
+_TRACKS_MESSAGE_ID = 1  # The event's ID becomes last_message_id
+_LOGS_TEXT = 2  # The event is logged together with its sender and text
+_EVENT_FLAGS: dict[str, int] = {
+    EventType.MESSAGE: _TRACKS_MESSAGE_ID | _LOGS_TEXT,
+    EventType.UPDATE: _TRACKS_MESSAGE_ID | _LOGS_TEXT,
+    EventType.REPLY_START: _TRACKS_MESSAGE_ID,
+    EventType.SPEECH_PLAYBACK_START: _TRACKS_MESSAGE_ID,
+}
+
+
+# Session override set by VoxtaClient.use_session() for the current task and the tasks it starts
+_current_session: ContextVar[Optional[dict["VoxtaClient", str]]] = ContextVar(
+    "voxta_session", default=None
+)
+
+
+def requires_session(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Resolve the `session_id` argument of a session-scoped API method.
+
+    The wrapped coroutine always receives a concrete session ID (explicit argument,
+    then `use_session()` override, then the active session). The call is a silent
+    no-op when none is available.
+    """
+    position = list(inspect.signature(method).parameters).index("session_id") - 1
+
+    @functools.wraps(method)
+    async def wrapper(self: "VoxtaClient", *args: Any, **kwargs: Any) -> Any:
+        if len(args) > position:
+            session_id = self._resolve_session(args[position])
+            if not session_id:
+                return None
+            args = (*args[:position], session_id, *args[position + 1 :])
+        else:
+            session_id = self._resolve_session(kwargs.get("session_id"))
+            if not session_id:
+                return None
+            kwargs["session_id"] = session_id
+        return await method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_cached_message(message_cls: type[ClientMessage], *fields: tuple[str, Any]) -> str:
+    # Commands built only from defaults and a session ID, flag or label (authenticate,
+    # register_app, typing, revert, pause, ...) always encode to the same JSON for the same field
+    # values, so encode each once and reuse it.
+    return dumps(message_cls(**dict(fields)).to_dict())
+
 
 class VoxtaClient:
     """
     High-level client for interacting with the Voxta conversational AI platform.
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, random_invocation_ids: bool = False):
+        """
+        Initialize the client.
+
+        Args:
+            url: The base URL of the Voxta server.
+            random_invocation_ids: Use a random UUID4 for every SignalR invocation ID
+                instead of a per-connection prefix and counter.
+        """
         self.url = url
+        self.random_invocation_ids = random_invocation_ids
         self.logger = logging.getLogger("VoxtaClient")
         self.transport = VoxtaTransport(url, logger=self.logger.getChild("Transport"))
         self.transport.set_callbacks(
             on_message=self._handle_server_message, on_close=self._handle_close
         )
 
-        self.callbacks: dict[str, list[Callable]] = {}
+        # Callbacks bucketed by kind once at registration and stored as immutable
+        # tuples, so _emit never inspects a callback or copies a list
+        self._sync_handlers: dict[str, tuple[Callable, ...]] = {}
+        self._async_handlers: dict[str, tuple[Callable, ...]] = {}
         self.session_id: Optional[str] = None
         self.is_speaking = False
         self.is_thinking = False
         self.last_message_id: Optional[str] = None
         self._active_chat_id: Optional[str] = None
+        # Strong references to fire-and-forget tasks so they aren't collected mid-await
+        self._pending_tasks: set[asyncio.Task] = set()
+        # Loop the connection runs on, for callbacks that arrive from another thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set once a session is pinned; created lazily on the running loop because
+        # asyncio.Event binds to the loop it was created on before Python 3.10
+        self._ready: Optional[asyncio.Event] = None
+        # Resolved when the connection closes, so wait_until_ready() callers don't
+        # keep waiting for a session that can no longer arrive
+        self._closed: Optional[asyncio.Future] = None
+        # Invocation IDs only need to be unique per connection, so a counter behind a
+        # random per-connection prefix replaces a uuid4() call per message
+        self._invocation_prefix = uuid.uuid4().hex[:8]
+        self._invocation_counter = itertools.count()
+        # Message IDs are time-ordered UUIDs: a random per-client node plus a counter
+        # keeps them unique without reading os.urandom for every message
+        self._message_id_node = int.from_bytes(os.urandom(4), "big") >> 2
+        self._message_id_counter = itertools.count()
+        # Internal state handlers keyed by event $type, resolved with one dict lookup
+        self._router: dict[str, Callable[[dict[str, Any]], Awaitable[None]]] = {
+            EventType.WELCOME: self._handle_welcome,
+            EventType.CHATS_SESSIONS_UPDATED: self._handle_sessions_updated,
+            EventType.CHAT_STARTED: self._handle_chat_started,
+            EventType.ERROR: self._handle_error,
+            EventType.REPLY_GENERATING: self._handle_reply_started,
+            EventType.REPLY_START: self._handle_reply_started,
+            EventType.REPLY_END: self._handle_reply_end,
+            EventType.SPEECH_PLAYBACK_START: self._handle_speech_start,
+            EventType.SPEECH_PLAYBACK_COMPLETE: self._handle_speech_complete,
+            EventType.INTERRUPT_SPEECH: self._handle_interrupt_speech,
+        }
 
     @property
     def running(self) -> bool:
@@ -74,25 +179,61 @@ class VoxtaClient:
             callback: The callback function to execute. If None, returns a decorator.
         """
         if callback is not None:
-            if event_name not in self.callbacks:
-                self.callbacks[event_name] = []
-            self.callbacks[event_name].append(callback)
+            self._add_callback(event_name, callback)
             return callback
 
         def decorator(inner_callback: Callable):
-            if event_name not in self.callbacks:
-                self.callbacks[event_name] = []
-            self.callbacks[event_name].append(inner_callback)
+            self._add_callback(event_name, inner_callback)
             return inner_callback
 
         return decorator
 
+    def off(self, event_name: str, callback: Optional[Callable] = None):
+        """
+        Unregister a callback for a specific event.
+
+        Args:
+            event_name: The name of the event the callback was registered for.
+            callback: The callback to remove. If None, every callback for the event is
+                removed. Callbacks that aren't registered are ignored.
+        """
+        if callback is None:
+            self._sync_handlers.pop(event_name, None)
+            self._async_handlers.pop(event_name, None)
+            return
+
+        handlers = self._handlers_for(callback)
+        registered = handlers.get(event_name, ())
+        if callback not in registered:
+            return
+        index = registered.index(callback)
+        remaining = registered[:index] + registered[index + 1 :]
+        if remaining:
+            handlers[event_name] = remaining
+        else:
+            del handlers[event_name]
+
+    def _add_callback(self, event_name: str, callback: Callable):
+        handlers = self._handlers_for(callback)
+        handlers[event_name] = handlers.get(event_name, ()) + (callback,)
+
+    def _handlers_for(self, callback: Callable) -> dict[str, tuple[Callable, ...]]:
+        if asyncio.iscoroutinefunction(callback):
+            return self._async_handlers
+        return self._sync_handlers
+
     def negotiate(self):
         """
         Perform the initial SignalR HTTP negotiation.
         """
         return self.transport.negotiate()
 
+    async def negotiate_async(self):
+        """
+        Perform the initial SignalR HTTP negotiation without blocking the event loop.
+        """
+        return await self.transport.negotiate_async()
+
     async def connect(self, connection_token: str, cookies: Optional[dict[str, str]] = None):
         """
         Establish the SignalR connection and authenticate.
@@ -101,38 +242,166 @@ class VoxtaClient:
             connection_token: The SignalR connection token obtained from negotiation.
             cookies: Optional cookies to include in the connection request.
         """
-        await self.transport.connect(connection_token, cookies)
-        await self.authenticate(connection_token)
+        self._loop = asyncio.get_running_loop()
+        self._invocation_prefix = uuid.uuid4().hex[:8]
+        self._invocation_counter = itertools.count()
+        self._ready_event().clear()
+        try:
+            await self.transport.connect(connection_token, cookies)
+            await self.authenticate(connection_token)
+        except BaseException:
+            # No read loop will ever report a close for this attempt, so release anyone
+            # in wait_until_ready() now, including when connect() itself is cancelled
+            self._wake_ready_waiters()
+            raise
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait until the client is pinned to a chat session.
+
+        Completes when the `ready` event fires, or immediately if it already has for
+        the current connection.
+
+        Args:
+            timeout: Optional number of seconds to wait before raising
+                asyncio.TimeoutError.
+
+        Returns:
+            The active session ID.
+
+        Raises:
+            asyncio.TimeoutError: If no session is ready within `timeout` seconds.
+            VoxtaConnectionError: If the connection closes before a session is ready.
+        """
+        ready = self._ready_event()
+        if ready.is_set():
+            return self.session_id
+
+        if self._closed is None:
+            self._closed = asyncio.get_running_loop().create_future()
+        ready_wait = asyncio.ensure_future(ready.wait())
+        try:
+            await asyncio.wait_for(
+                asyncio.wait({ready_wait, self._closed}, return_when=asyncio.FIRST_COMPLETED),
+                timeout,
+            )
+            if not ready_wait.done():
+                raise VoxtaConnectionError("Connection closed before a session was ready")
+        finally:
+            ready_wait.cancel()
+        return self.session_id
+
+    def _ready_event(self) -> asyncio.Event:
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    def _wake_ready_waiters(self):
+        if self._ready is not None:
+            self._ready.clear()
+        closed, self._closed = self._closed, None
+        if closed is not None and not closed.done():
+            closed.set_result(None)
+
+    @contextlib.contextmanager
+    def use_session(self, session_id: str) -> Iterator[None]:
+        """
+        Route session-scoped calls to `session_id` within the current task.
+
+        The override follows the current context, so tasks created inside the block
+        inherit it while concurrently running tasks keep their own session. An explicit
+        `session_id` argument still takes precedence.
+
+        Args:
+            session_id: The session ID to use by default inside the block.
+        """
+        token = _current_session.set({**(_current_session.get() or {}), self: session_id})
+        try:
+            yield
+        finally:
+            _current_session.reset(token)
+
+    def _resolve_session(self, session_id: Optional[str]) -> Optional[str]:
+        if session_id:
+            return session_id
+        overrides = _current_session.get()
+        return (overrides and overrides.get(self)) or self.session_id
+
+    def _next_invocation_id(self) -> str:
+        if self.random_invocation_ids:
+            return str(uuid.uuid4())
+        return f"{self._invocation_prefix}-{next(self._invocation_counter):x}"
+
+    def _next_message_id(self) -> str:
+        # UUIDv7 layout (48-bit Unix ms timestamp, version, variant) so IDs sort by
+        # creation time and still parse as GUIDs on the server
+        value = (
+            (time.time_ns() // 1_000_000) << 80
+            | 0x7 << 76
+            | 0b10 << 62
+            | self._message_id_node << 32
+            | next(self._message_id_counter) & 0xFFFFFFFF
+        )
+        h = f"{value:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
     async def _send_client_message(self, message: ClientMessage):
         """
         Internal method to wrap and send a Voxta message over SignalR.
         """
-        invocation_id = str(uuid.uuid4())
-        payload = message.to_signalr_invocation(invocation_id)
-        await self._send_raw(payload)
-
-    async def _send_raw(self, payload: dict[str, Any]):
-        # Emit an event for outgoing messages so listeners (like the proxy) can track them
-        # SignalR messages of type 1 are Invocations
-        if payload.get("type") == 1:
-            args = payload.get("arguments", [])
-            invocation_id = payload.get("invocationId")
-            if args:
-                # The actual Voxta message is usually the first argument
-                data = args[0]
-                if isinstance(data, dict) and invocation_id:
-                    data["invocationId"] = invocation_id
-                await self._emit("client_send", data)
-
-        await self.transport.send(payload)
+        await self.transport.send_record(await self._encode_message(message))
+
+    async def _send_cached_message(self, message_cls: type[ClientMessage], **fields: Any):
+        """
+        Internal method to send a message whose fields are a few hashable values that
+        repeat across calls, reusing its encoded JSON.
+        """
+        invocation_id = self._next_invocation_id()
+        if self._sync_handlers.get("client_send") or self._async_handlers.get("client_send"):
+            data = message_cls(**fields).to_dict()
+            await self._emit("client_send", {**data, "invocationId": invocation_id})
+
+        argument = _encode_cached_message(message_cls, *fields.items())
+        await self.transport.send_record(_invocation_record(invocation_id, argument))
+
+    async def _send_payload(self, type_name: str, **fields: Any):
+        """
+        Internal method to send a message made only of plain values and containers,
+        building its argument dict directly instead of going through the model.
+        """
+        data: dict[str, Any] = {"$type": type_name}
+        for key, value in fields.items():
+            if value is not None:
+                data[key] = value
+        await self.transport.send_record(await self._encode_invocation(data))
+
+    async def _send_client_messages(self, messages: list[ClientMessage]):
+        """
+        Internal method to send several Voxta messages in a single SignalR frame.
+        """
+        records = [await self._encode_message(message) for message in messages]
+        await self.transport.send_records(records)
+
+    async def _encode_invocation(self, data: dict[str, Any]) -> str:
+        # Only the message itself is serialized; the envelope around it is a fixed template
+        invocation_id = self._next_invocation_id()
+        if self._sync_handlers.get("client_send") or self._async_handlers.get("client_send"):
+            # Emit an event for outgoing messages so listeners (like the proxy) can track them
+            await self._emit("client_send", {**data, "invocationId": invocation_id})
+        return _invocation_record(invocation_id, dumps(data))
+
+    async def _encode_message(self, message: ClientMessage) -> str:
+        invocation_id = self._next_invocation_id()
+        if self._sync_handlers.get("client_send") or self._async_handlers.get("client_send"):
+            await self._emit("client_send", {**message.to_dict(), "invocationId": invocation_id})
+        return message.to_signalr_record(invocation_id)
 
     async def authenticate(self, _token: str):
         """
         Send the initial authentication message to the server.
         """
         self.logger.info("Authenticating...")
-        await self._send_client_message(ClientAuthenticateMessage())
+        await self._send_cached_message(ClientAuthenticateMessage)
 
     async def register_app(self, label: str = "Voxta Python Client"):
         """
@@ -141,9 +410,9 @@ class VoxtaClient:
         Args:
             label: A human-readable label for this client.
         """
-        self.logger.info(f"Registering app: {label}")
-        await self._send_client_message(
-            ClientRegisterAppMessage(clientVersion="1.2.1", label=label)
+        self.logger.info("Registering app: %s", label)
+        await self._send_cached_message(
+            ClientRegisterAppMessage, clientVersion="1.2.1", label=label
         )
 
     async def start_chat(self, character_id: str, contexts: Optional[list[dict[str, Any]]] = None):
@@ -154,9 +423,10 @@ class VoxtaClient:
             character_id: The ID of the character to chat with.
             contexts: Optional list of context objects to initialize the chat.
         """
-        msg = ClientStartChatMessage(characterId=character_id, contexts=contexts or [])
-        self.logger.info(f"Starting chat with character: {character_id}")
-        await self._send_client_message(msg)
+        self.logger.info("Starting chat with character: %s", character_id)
+        await self._send_payload(
+            ClientStartChatMessage.type_name, characterId=character_id, contexts=contexts or []
+        )
 
     async def resume_chat(self, chat_id: str):
         """
@@ -166,7 +436,7 @@ class VoxtaClient:
             chat_id: The ID of the chat to resume.
         """
         msg = ClientResumeChatMessage(chatId=chat_id)
-        self.logger.info(f"Resuming chat: {chat_id}")
+        self.logger.info("Resuming chat: %s", chat_id)
         await self._send_client_message(msg)
 
     async def stop_chat(self, chat_id: str):
@@ -177,9 +447,10 @@ class VoxtaClient:
             chat_id: The ID of the chat to stop.
         """
         msg = ClientStopChatMessage(chatId=chat_id)
-        self.logger.info(f"Stopping chat: {chat_id}")
+        self.logger.info("Stopping chat: %s", chat_id)
         await self._send_client_message(msg)
 
+    @requires_session
     async def trigger_action(
         self,
         action: str,
@@ -194,14 +465,15 @@ class VoxtaClient:
             arguments: Optional dictionary of arguments for the action.
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
         msg = ClientTriggerActionMessage(
-            sessionId=target_session, messageId=str(uuid.uuid4()), value=action, arguments=arguments
+            sessionId=session_id,
+            messageId=self._next_message_id(),
+            value=action,
+            arguments=arguments,
         )
         await self._send_client_message(msg)
 
+    @requires_session
     async def revert(self, session_id: Optional[str] = None):
         """
         Revert the last message in the session.
@@ -209,12 +481,9 @@ class VoxtaClient:
         Args:
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientRevertMessage(sessionId=target_session)
-        await self._send_client_message(msg)
+        await self._send_cached_message(ClientRevertMessage, sessionId=session_id)
 
+    @requires_session
     async def retry(self, session_id: Optional[str] = None):
         """
         Retry the last AI response generation.
@@ -222,12 +491,9 @@ class VoxtaClient:
         Args:
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientRetryMessage(sessionId=target_session)
-        await self._send_client_message(msg)
+        await self._send_cached_message(ClientRetryMessage, sessionId=session_id)
 
+    @requires_session
     async def typing_start(self, session_id: Optional[str] = None):
         """
         Notify the server that the user has started typing.
@@ -235,12 +501,9 @@ class VoxtaClient:
         Args:
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientTypingStartMessage(sessionId=target_session)
-        await self._send_client_message(msg)
+        await self._send_cached_message(ClientTypingStartMessage, sessionId=session_id)
 
+    @requires_session
     async def typing_end(self, session_id: Optional[str] = None):
         """
         Notify the server that the user has stopped typing.
@@ -248,23 +511,19 @@ class VoxtaClient:
         Args:
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientTypingEndMessage(sessionId=target_session)
-        await self._send_client_message(msg)
+        await self._send_cached_message(ClientTypingEndMessage, sessionId=session_id)
 
     async def load_characters_list(self):
         """
         Request the list of available characters.
         """
-        await self._send_client_message(ClientLoadCharactersListMessage())
+        await self._send_cached_message(ClientLoadCharactersListMessage)
 
     async def load_scenarios_list(self):
         """
         Request the list of available scenarios.
         """
-        await self._send_client_message(ClientLoadScenariosListMessage())
+        await self._send_cached_message(ClientLoadScenariosListMessage)
 
     async def load_chats_list(
         self, character_id: Optional[str] = None, scenario_id: Optional[str] = None
@@ -279,6 +538,7 @@ class VoxtaClient:
         msg = ClientLoadChatsListMessage(characterId=character_id, scenarioId=scenario_id)
         await self._send_client_message(msg)
 
+    @requires_session
     async def add_chat_participant(self, character_id: str, session_id: Optional[str] = None):
         """
         Add a character as a participant to the current chat session.
@@ -287,12 +547,10 @@ class VoxtaClient:
             character_id: The ID of the character to add.
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientAddChatParticipantMessage(sessionId=target_session, characterId=character_id)
+        msg = ClientAddChatParticipantMessage(sessionId=session_id, characterId=character_id)
         await self._send_client_message(msg)
 
+    @requires_session
     async def remove_chat_participant(self, character_id: str, session_id: Optional[str] = None):
         """
         Remove a character from the current chat session.
@@ -301,12 +559,10 @@ class VoxtaClient:
             character_id: The ID of the character to remove.
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientRemoveChatParticipantMessage(sessionId=target_session, characterId=character_id)
+        msg = ClientRemoveChatParticipantMessage(sessionId=session_id, characterId=character_id)
         await self._send_client_message(msg)
 
+    @requires_session
     async def request_suggestions(self, session_id: Optional[str] = None):
         """
         Request message suggestions from the AI.
@@ -314,12 +570,9 @@ class VoxtaClient:
         Args:
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientRequestSuggestionsMessage(sessionId=target_session)
-        await self._send_client_message(msg)
+        await self._send_cached_message(ClientRequestSuggestionsMessage, sessionId=session_id)
 
+    @requires_session
     async def inspect_audio_input(self, enabled: bool, session_id: Optional[str] = None):
         """
         Toggle audio input inspection mode.
@@ -328,12 +581,10 @@ class VoxtaClient:
             enabled: Whether to enable or disable inspection.
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientInspectAudioInputMessage(sessionId=target_session, enabled=enabled)
+        msg = ClientInspectAudioInputMessage(sessionId=session_id, enabled=enabled)
         await self._send_client_message(msg)
 
+    @requires_session
     async def update_message(self, message_id: str, text: str, session_id: Optional[str] = None):
         """
         Update the text of a previous message.
@@ -343,12 +594,10 @@ class VoxtaClient:
             text: The new text for the message.
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientUpdateMessageMessage(sessionId=target_session, messageId=message_id, text=text)
+        msg = ClientUpdateMessageMessage(sessionId=session_id, messageId=message_id, text=text)
         await self._send_client_message(msg)
 
+    @requires_session
     async def delete_message(self, message_id: str, session_id: Optional[str] = None):
         """
         Delete a message from the session history.
@@ -357,10 +606,7 @@ class VoxtaClient:
             message_id: The ID of the message to delete.
             session_id: Optional session ID. Defaults to the active session.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientDeleteMessageMessage(sessionId=target_session, messageId=message_id)
+        msg = ClientDeleteMessageMessage(sessionId=session_id, messageId=message_id)
         await self._send_client_message(msg)
 
     async def subscribe_to_chat(self, session_id: str, chat_id: str):
@@ -371,9 +617,10 @@ class VoxtaClient:
             session_id: The session ID.
             chat_id: The chat ID.
         """
-        msg = ClientSubscribeToChatMessage(sessionId=session_id, chatId=chat_id)
-        self.logger.info(f"Subscribing to chat: {chat_id}")
-        await self._send_client_message(msg)
+        self.logger.info("Subscribing to chat: %s", chat_id)
+        await self._send_payload(
+            ClientSubscribeToChatMessage.type_name, sessionId=session_id, chatId=chat_id
+        )
 
     async def inspect(self, session_id: str, enabled: bool = True):
         """
@@ -384,7 +631,7 @@ class VoxtaClient:
             enabled: Whether to enable or disable inspection.
         """
         msg = ClientInspectMessage(sessionId=session_id, enabled=enabled)
-        self.logger.info(f"Sending inspect: session={session_id}, enabled={enabled}")
+        self.logger.info("Sending inspect: session=%s, enabled=%s", session_id, enabled)
         await self._send_client_message(msg)
 
     async def send_message(
@@ -405,7 +652,7 @@ class VoxtaClient:
             do_user_inference: Whether to perform action inference on the user message.
             do_character_inference: Whether to perform action inference for the character response.
         """
-        target_session = session_id or self.session_id
+        target_session = self._resolve_session(session_id)
         if not target_session:
             self.logger.error("No session ID available to send message")
             return
@@ -417,22 +664,59 @@ class VoxtaClient:
             doUserActionInference=do_user_inference,
             doCharacterActionInference=do_character_inference,
         )
-        self.logger.info(f"Sending message to session {target_session}: {text[:50]}...")
+        self.logger.info("Sending message to session %s: %.50s...", target_session, text)
         await self._send_client_message(msg)
 
-    async def interrupt(self, session_id: Optional[str] = None):
+    async def send_messages(
+        self,
+        texts: list[str],
+        session_id: Optional[str] = None,
+        do_reply: bool = True,
+        do_user_inference: bool = True,
+        do_character_inference: bool = True,
+    ):
         """
-        Interrupt the current AI response/speech.
+        Send several user messages to the session in a single SignalR frame.
+
+        Useful for relaying bursts of background context without paying for one
+        WebSocket frame per message.
 
         Args:
+            texts: The message texts, in the order they should be delivered.
             session_id: Optional session ID. Defaults to the active session.
+            do_reply: Whether the AI should generate a reply immediately.
+            do_user_inference: Whether to perform action inference on the user messages.
+            do_character_inference: Whether to perform action inference for the character response.
         """
-        target_session = session_id or self.session_id
+        target_session = self._resolve_session(session_id)
         if not target_session:
+            self.logger.error("No session ID available to send messages")
             return
-        msg = ClientInterruptMessage(sessionId=target_session)
-        await self._send_client_message(msg)
 
+        messages = [
+            ClientSendMessage(
+                sessionId=target_session,
+                text=text,
+                doReply=do_reply,
+                doUserActionInference=do_user_inference,
+                doCharacterActionInference=do_character_inference,
+            )
+            for text in texts
+        ]
+        self.logger.info("Sending %d messages to session %s", len(messages), target_session)
+        await self._send_client_messages(messages)
+
+    @requires_session
+    async def interrupt(self, session_id: Optional[str] = None):
+        """
+        Interrupt the current AI response/speech.
+
+        Args:
+            session_id: Optional session ID. Defaults to the active session.
+        """
+        await self._send_cached_message(ClientInterruptMessage, sessionId=session_id)
+
+    @requires_session
     async def pause(self, session_id: Optional[str] = None, pause: bool = True):
         """
         Pause automatic continuation of the chat.
@@ -441,11 +725,7 @@ class VoxtaClient:
             session_id: Optional session ID. Defaults to the active session.
             pause: Whether to pause or resume.
         """
-        target_session = session_id or self.session_id
-        if not target_session:
-            return
-        msg = ClientPauseMessage(sessionId=target_session, pause=pause)
-        await self._send_client_message(msg)
+        await self._send_cached_message(ClientPauseMessage, sessionId=session_id, pause=pause)
 
     async def character_speech_request(
         self,
@@ -461,7 +741,7 @@ class VoxtaClient:
             session_id: Optional session ID. Defaults to the active session.
             text: Optional specific text to speak.
         """
-        target_session = session_id or self.session_id
+        target_session = self._resolve_session(session_id)
 
         if not target_session:
             self.logger.warning("Cannot send characterSpeechRequest: missing session_id")
@@ -470,7 +750,7 @@ class VoxtaClient:
         msg = ClientCharacterSpeechRequestMessage(
             sessionId=target_session, characterId=character_id, text=text
         )
-        self.logger.info(f"Sending characterSpeechRequest for character: {character_id}")
+        self.logger.info("Sending characterSpeechRequest for character: %s", character_id)
         await self._send_client_message(msg)
 
     async def speech_playback_start(
@@ -483,7 +763,7 @@ class VoxtaClient:
             session_id: Optional session ID. Defaults to the active session.
             message_id: Optional message ID. Defaults to the last received message.
         """
-        target_session = session_id or self.session_id
+        target_session = self._resolve_session(session_id)
         target_message = message_id or self.last_message_id
 
         if not target_session or not target_message:
@@ -491,7 +771,7 @@ class VoxtaClient:
             return
 
         msg = ClientSpeechPlaybackStartMessage(sessionId=target_session, messageId=target_message)
-        self.logger.info(f"Sending speechPlaybackStart for message: {target_message}")
+        self.logger.info("Sending speechPlaybackStart for message: %s", target_message)
         await self._send_client_message(msg)
 
     async def speech_playback_complete(
@@ -504,7 +784,7 @@ class VoxtaClient:
             session_id: Optional session ID. Defaults to the active session.
             message_id: Optional message ID. Defaults to the last received message.
         """
-        target_session = session_id or self.session_id
+        target_session = self._resolve_session(session_id)
         target_message = message_id or self.last_message_id
 
         if not target_session or not target_message:
@@ -516,7 +796,7 @@ class VoxtaClient:
         msg = ClientSpeechPlaybackCompleteMessage(
             sessionId=target_session, messageId=target_message
         )
-        self.logger.info(f"Sending speechPlaybackComplete for message: {target_message}")
+        self.logger.info("Sending speechPlaybackComplete for message: %s", target_message)
         await self._send_client_message(msg)
 
     async def update_context(
@@ -541,7 +821,8 @@ class VoxtaClient:
             set_flags: Optional list of flags to set.
             enable_roles: Optional dictionary to enable/disable specific roles.
         """
-        msg = ClientUpdateContextMessage(
+        await self._send_payload(
+            ClientUpdateContextMessage.type_name,
             sessionId=session_id,
             contextKey=context_key,
             contexts=contexts,
@@ -550,7 +831,6 @@ class VoxtaClient:
             setFlags=set_flags,
             enableRoles=enable_roles,
         )
-        await self._send_client_message(msg)
 
     async def _handle_server_message(self, message: dict[str, Any]):
         msg_type = message.get("type")
@@ -573,10 +853,10 @@ class VoxtaClient:
             }
 
             if error:
-                self.logger.error(f"Invocation {invocation_id} failed: {error}")
+                self.logger.error("Invocation %s failed: %s", invocation_id, error)
                 await self._emit(EventType.ERROR, completion_data)
             else:
-                self.logger.debug(f"Invocation {invocation_id} completed")
+                self.logger.debug("Invocation %s completed", invocation_id)
                 await self._emit("completion", completion_data)
             return
 
@@ -596,67 +876,86 @@ class VoxtaClient:
         if not event_type:
             return
 
-        # Track message IDs
-        msg_id = payload.get("messageId") or payload.get("id")
-        if msg_id and event_type in [
-            EventType.MESSAGE,
-            EventType.UPDATE,
-            EventType.REPLY_START,
-            EventType.SPEECH_PLAYBACK_START,
-        ]:
-            self.last_message_id = msg_id
-
-        # Logging
-        if event_type in [EventType.MESSAGE, EventType.UPDATE]:
-            sender = payload.get("senderType") or payload.get("role")
-            text = payload.get("text", "")[:100]
-            self.logger.info(f"Voxta Event: {event_type} | From {sender}: {text}...")
-        else:
-            self.logger.info(f"Voxta Event: {event_type}")
+        # Streaming chunks are the highest-rate event and touch no client state, so
+        # hand them straight to listeners without the tracking and logging below.
+        if event_type == EventType.REPLY_CHUNK:
+            await self._emit(event_type, payload)
+            return
 
-        # Internal state management
-        if event_type == EventType.WELCOME:
-            await self.register_app()
-        elif event_type == EventType.CHATS_SESSIONS_UPDATED:
-            await self._handle_sessions_updated(payload)
-        elif event_type == EventType.CHAT_STARTED:
-            await self._handle_chat_started(payload)
-        elif event_type == EventType.ERROR:
-            err_msg = payload.get("message", "")
-            if "Chat session already exists" in err_msg:
+        flags = _EVENT_FLAGS.get(event_type, 0)
+
+        # Track message IDs, looking them up only for events that carry one
+        if flags & _TRACKS_MESSAGE_ID:
+            msg_id = payload.get("messageId") or payload.get("id")
+            if msg_id:
+                self.last_message_id = msg_id
+
+        # Logging, skipped entirely when INFO is filtered out
+        if self.logger.isEnabledFor(logging.INFO):
+            if flags & _LOGS_TEXT:
+                # %.100s truncates the text while formatting, without slicing a copy first
                 self.logger.info(
-                    "Ignoring 'Chat session already exists' error "
-                    "(this is normal during proxy resumption)."
+                    "Voxta Event: %s | From %s: %.100s...",
+                    event_type,
+                    payload.get("senderType") or payload.get("role"),
+                    payload.get("text", ""),
                 )
             else:
-                self.logger.error(f"Voxta Error: {err_msg}")
-        elif event_type in [EventType.REPLY_GENERATING, EventType.REPLY_START]:
-            self.is_thinking = True
-        elif event_type == EventType.REPLY_END:
-            self.is_thinking = False
-        elif event_type == EventType.SPEECH_PLAYBACK_START:
-            self.is_speaking = True
-        elif event_type in [EventType.SPEECH_PLAYBACK_COMPLETE, EventType.INTERRUPT_SPEECH]:
-            self.is_speaking = False
-            if event_type == EventType.INTERRUPT_SPEECH:
-                self.is_thinking = False
+                self.logger.info("Voxta Event: %s", event_type)
+
+        # Internal state management
+        handler = self._router.get(event_type)
+        if handler is not None:
+            await handler(payload)
 
         # Emit event
         await self._emit(event_type, payload)
 
+    async def _handle_welcome(self, _payload: dict[str, Any]):
+        await self.register_app()
+
+    async def _handle_error(self, payload: dict[str, Any]):
+        err_msg = payload.get("message", "")
+        if "Chat session already exists" in err_msg:
+            self.logger.info(
+                "Ignoring 'Chat session already exists' error "
+                "(this is normal during proxy resumption)."
+            )
+        else:
+            self.logger.error("Voxta Error: %s", err_msg)
+
+    async def _handle_reply_started(self, _payload: dict[str, Any]):
+        self.is_thinking = True
+
+    async def _handle_reply_end(self, _payload: dict[str, Any]):
+        self.is_thinking = False
+
+    async def _handle_speech_start(self, _payload: dict[str, Any]):
+        self.is_speaking = True
+
+    async def _handle_speech_complete(self, _payload: dict[str, Any]):
+        self.is_speaking = False
+
+    async def _handle_interrupt_speech(self, _payload: dict[str, Any]):
+        self.is_speaking = False
+        self.is_thinking = False
+
     async def _handle_sessions_updated(self, payload: dict[str, Any]):
         sessions = payload.get("sessions", [])
         if sessions:
-            target = next(
-                (s for s in sessions if s.get("chatId") == self._active_chat_id),
-                sessions[0],
-            )
+            # Prefer the chat we are already pinned to, otherwise the first session
+            target = sessions[0]
+            for session in sessions:
+                if session.get("chatId") == self._active_chat_id:
+                    target = session
+                    break
             chat_id = target.get("chatId")
             self._active_chat_id = chat_id
             self.session_id = target.get("sessionId")
 
-            self.logger.info(f"Pinned to Chat: {chat_id} (Session: {self.session_id})")
+            self.logger.info("Pinned to Chat: %s (Session: %s)", chat_id, self.session_id)
             await self.subscribe_to_chat(self.session_id, chat_id)
+            self._ready_event().set()
             await self._emit(EventType.READY, self.session_id)
 
     async def _handle_chat_started(self, payload: dict[str, Any]):
@@ -664,23 +963,50 @@ class VoxtaClient:
         chat_id = payload.get("chatId")
         self._active_chat_id = chat_id
 
-        self.logger.info(f"Chat started: {chat_id} (Session: {self.session_id})")
+        self.logger.info("Chat started: %s (Session: %s)", chat_id, self.session_id)
+        self._ready_event().set()
         await self._emit(EventType.READY, self.session_id)
 
     async def _emit(self, event_name: str, data: Any):
-        if event_name in self.callbacks:
-            for cb in self.callbacks[event_name]:
-                try:
-                    if asyncio.iscoroutinefunction(cb):
-                        await cb(data)
-                    else:
-                        cb(data)
-                except Exception as e:
-                    self.logger.error(f"Error in callback for {event_name}: {e}")
+        for cb in self._sync_handlers.get(event_name, ()):
+            try:
+                cb(data)
+            except Exception as e:
+                self.logger.error("Error in callback for %s: %s", event_name, e)
+        async_handlers = self._async_handlers.get(event_name)
+        if not async_handlers:
+            return
+        if len(async_handlers) == 1:
+            await self._run_async_callback(event_name, async_handlers[0], data)
+        else:
+            # Independent listeners run concurrently so a slow one doesn't hold up the rest
+            await asyncio.gather(
+                *(self._run_async_callback(event_name, cb, data) for cb in async_handlers)
+            )
+
+    async def _run_async_callback(self, event_name: str, cb: Callable, data: Any):
+        try:
+            await cb(data)
+        except Exception as e:
+            self.logger.error("Error in callback for %s: %s", event_name, e)
 
     def _handle_close(self):
         self.logger.info("Connection closed")
-        asyncio.create_task(self._emit("close", None))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            self._wake_ready_waiters()
+            task = loop.create_task(self._emit("close", None))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+        elif self._loop is not None and not self._loop.is_closed():
+            # Called off the event loop thread; hand the state change and the emit back
+            # to the client's loop
+            self._loop.call_soon_threadsafe(self._wake_ready_waiters)
+            asyncio.run_coroutine_threadsafe(self._emit("close", None), self._loop)
 
     async def close(self):
         """
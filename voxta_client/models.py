@@ -1,22 +1,108 @@
-from dataclasses import dataclass, field
-from typing import Any, Optional
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Callable, Optional
+
+from voxta_client._json import dumps
+from voxta_client.exceptions import VoxtaProtocolError
+
+# SignalR invocation envelope with slots for the invocation ID and the encoded message
+_INVOCATION_RECORD = '{"type":1,"invocationId":%s,"target":"SendMessage","arguments":[%s]}'
+
+
+def _invocation_record(invocation_id: str, argument: str) -> str:
+    """Wraps an already-encoded message argument in a SignalR invocation record."""
+    return _INVOCATION_RECORD % (dumps(invocation_id), argument)
+
+
+def _compile_to_dict(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    Generate a to_dict function specialized to the dataclass fields of ``cls``.
+
+    The generated code reads each field directly instead of walking ``__dict__``, with
+    ``type_name`` emitted first as ``$type`` and ``None`` fields omitted.
+    """
+    names = [f.name for f in fields(cls)]
+    lines = ["def to_dict(self):"]
+    # Ensure $type is the first key in the resulting dictionary.
+    # This is often required by SignalR/Voxta for polymorphic deserialization.
+    lines.append('    res = {"$type": self.type_name}' if "type_name" in names else "    res = {}")
+    for name in names:
+        if name != "type_name":
+            lines.append(f"    v = self.{name}")
+            lines.append(f"    if v is not None: res[{name!r}] = v")
+    lines.append("    return res")
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102 - source is built from field names only
+    return namespace["to_dict"]
+
+
+def _bootstrap_to_dict(self: Any) -> dict[str, Any]:
+    # Swap in the specialized encoder for this exact class, then use it. A bound
+    # method taken before the first call still lands here, so reuse the compiled one.
+    cls = type(self)
+    encoder = cls.__dict__.get("to_dict")
+    if encoder is None or encoder is _bootstrap_to_dict:
+        encoder = cls.to_dict = _compile_to_dict(cls)
+    return encoder(self)
+
+
+def _compile_from_dict(cls: type) -> Callable[[dict[str, Any]], Any]:
+    """
+    Generate a constructor that builds ``cls`` from a payload dict without ``__init__``.
+
+    Required fields are read with ``data[name]`` and raise ``KeyError`` when absent; the
+    others fall back to their declared default or ``default_factory``. Keys that are not
+    fields are ignored, and ``type_name`` always takes the class default.
+    """
+    namespace: dict[str, Any] = {"_new": object.__new__, "_cls": cls, "_missing": MISSING}
+    lines = ["def from_dict(data):", "    self = _new(_cls)"]
+    for f in fields(cls):
+        if f.name == "type_name":
+            namespace["_type_name"] = f.default
+            lines.append("    self.type_name = _type_name")
+        elif f.default is not MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            lines.append(f"    self.{f.name} = data.get({f.name!r}, _default_{f.name})")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            lines.append(f"    v = data.get({f.name!r}, _missing)")
+            lines.append(f"    self.{f.name} = _factory_{f.name}() if v is _missing else v")
+        else:
+            lines.append(f"    self.{f.name} = data[{f.name!r}]")
+    lines.append("    return self")
+
+    exec("\n".join(lines), namespace)  # noqa: S102 - source is built from field names only
+    return namespace["from_dict"]
+
+
+def _bootstrap_from_dict(cls: Any, data: dict[str, Any]) -> Any:
+    # Swap in the specialized constructor for this exact class, then use it. A
+    # reference taken before the first call still lands here, so reuse the compiled one.
+    build = cls.__dict__.get("_from_dict")
+    if isinstance(build, staticmethod):
+        return build.__func__(data)
+    build = _compile_from_dict(cls)
+    cls._from_dict = staticmethod(build)
+    return build(data)
 
 
 @dataclass
 class VoxtaModel:
     """Base class for Voxta data models."""
 
-    def to_dict(self) -> dict[str, Any]:
-        # Ensure $type is the first key in the resulting dictionary.
-        # This is often required by SignalR/Voxta for polymorphic deserialization.
-        res = {}
-        if "type_name" in self.__dict__:
-            res["$type"] = self.__dict__["type_name"]
+    to_dict = _bootstrap_to_dict
+    _from_dict = classmethod(_bootstrap_from_dict)
 
-        for k, v in self.__dict__.items():
-            if k != "type_name" and v is not None:
-                res[k] = v
-        return res
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # Fields are only known once @dataclass has run, so each model gets its own
+        # bootstrap that compiles the specialized encoder on first use. Keeping one per
+        # class means a subclass never inherits its parent's generated encoder.
+        if "to_dict" not in cls.__dict__:
+            cls.to_dict = _bootstrap_to_dict
+        # Same for the payload constructor used by parse_server_message
+        if "_from_dict" not in cls.__dict__:
+            cls._from_dict = classmethod(_bootstrap_from_dict)
 
 
 @dataclass
@@ -84,6 +170,23 @@ class ServerActionMessage(ServerMessage):
     type_name: str = "action"
 
 
+@dataclass
+class ServerAppTriggerMessage(ServerMessage):
+    """
+    A custom trigger sent from a scenario script (e.g. ``chat.appTrigger(...)``).
+
+    Attributes:
+        name: The name of the trigger.
+        arguments: The arguments passed alongside the trigger.
+        sessionId: The chat session the trigger originated from.
+    """
+
+    name: str
+    arguments: list[Any] = field(default_factory=list)
+    sessionId: Optional[str] = None  # noqa: N815
+    type_name: str = "appTrigger"
+
+
 @dataclass
 class ServerAuthenticationRequiredMessage(ServerMessage):
     """
@@ -482,6 +585,18 @@ class ClientMessage(VoxtaModel):
             "arguments": [self.to_dict()],
         }
 
+    def to_signalr_record(self, invocation_id: str) -> str:
+        """
+        Encodes the message as a ready-to-send SignalR invocation record.
+
+        Only the message itself goes through the JSON encoder; the fixed envelope is
+        a pre-encoded template. The record separator is added by the transport.
+
+        Args:
+            invocation_id: The SignalR invocation ID; it is JSON-encoded like any string.
+        """
+        return _invocation_record(invocation_id, dumps(self.to_dict()))
+
 
 @dataclass
 class ClientTriggerActionMessage(ClientMessage):
@@ -814,3 +929,41 @@ class ClientAuthenticateMessage(ClientMessage):
         }
     )
     type_name: str = "authenticate"
+
+
+def _registry(base: type) -> dict[str, Any]:
+    # Every concrete model declares its $type as the type_name default
+    return {
+        cls.type_name: cls
+        for cls in base.__subclasses__()
+        if isinstance(getattr(cls, "type_name", None), str)
+    }
+
+
+# $type -> model class, built once at import so lookups are a single dict probe
+SERVER_MESSAGE_TYPES: dict[str, type[ServerMessage]] = _registry(ServerMessage)
+CLIENT_MESSAGE_TYPES: dict[str, type[ClientMessage]] = _registry(ClientMessage)
+
+
+def parse_server_message(payload: dict[str, Any]) -> Optional[ServerMessage]:
+    """
+    Build the typed model for a server event payload.
+
+    Keys that are not fields of the model are ignored.
+
+    Args:
+        payload: A decoded Voxta event, including its ``$type``.
+
+    Returns:
+        The matching ServerMessage instance, or None if the ``$type`` is unknown.
+
+    Raises:
+        VoxtaProtocolError: If the payload lacks a field the model requires.
+    """
+    cls = SERVER_MESSAGE_TYPES.get(payload.get("$type", ""))
+    if cls is None:
+        return None
+    try:
+        return cls._from_dict(payload)
+    except KeyError as e:
+        raise VoxtaProtocolError(f"Invalid {cls.type_name} payload: missing field {e}") from e
@@ -1,13 +1,39 @@
 import asyncio
-import json
+import contextlib
 import logging
-from typing import Any, Callable, Optional
+import urllib.parse
+from typing import Any, Callable, Optional, Union
 
 import requests
 import websockets
+from requests.adapters import HTTPAdapter
 
+from voxta_client._json import DECODE_ERRORS, dumps, loads
 from voxta_client.exceptions import VoxtaConnectionError
 
+# Batches larger than this are sent as a fragmented message instead of being joined;
+# both its fragments and coalesced queued records are frames of at most this size
+_FRAGMENT_THRESHOLD = 64 * 1024
+# Upper bound on an unterminated record carried between frames
+_MAX_PENDING_RECORD = 16 * 1024 * 1024
+# How long close() waits for an in-flight write to flush before closing the socket
+_CLOSE_FLUSH_TIMEOUT = 5.0
+# SignalR keepalive pings, matched on the raw record so they are never decoded
+_PING_RECORDS = ('{"type":6}', b'{"type":6}')
+
+
+def _frame_end(records: list[str], start: int = 0) -> int:
+    # Index just past the records from start that fit in one frame of at most
+    # _FRAGMENT_THRESHOLD characters; a larger record still gets a frame of its own
+    end = start
+    size = 0
+    while end < len(records):
+        size += len(records[end])
+        if end > start and size > _FRAGMENT_THRESHOLD:
+            break
+        end += 1
+    return end
+
 
 class VoxtaTransport:
     """
@@ -16,11 +42,25 @@ class VoxtaTransport:
 
     def __init__(self, url: str, logger: Optional[logging.Logger] = None):
         self.url = url
+        # Only the scheme prefix is rewritten (http -> ws, https -> wss)
+        self._ws_base = url.replace("http", "ws", 1) + "/hub"
         self.logger = logger or logging.getLogger("VoxtaTransport")
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.running = False
+        # Reused across negotiations so reconnects keep the pooled HTTP connection
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
         self._on_message_callback: Optional[Callable[[dict[str, Any]], Any]] = None
         self._on_close_callback: Optional[Callable[[], Any]] = None
+        # Trailing partial SignalR record carried over to the next frame
+        self._pending: Union[str, bytes] = ""
+        # Records queued while a write is in flight, flushed together by that writer;
+        # the future resolves once the writer has drained the outbox, or fails with
+        # VoxtaConnectionError if the queued records could not be sent
+        self._outbox: list[str] = []
+        self._flush_done: Optional[asyncio.Future] = None
 
     def set_callbacks(
         self,
@@ -32,33 +72,35 @@ class VoxtaTransport:
 
     def negotiate(self) -> tuple[Optional[str], Optional[dict[str, str]]]:
         try:
-            response = requests.post(f"{self.url}/hub/negotiate?negotiateVersion=1", timeout=10)
+            response = self._http.post(f"{self.url}/hub/negotiate?negotiateVersion=1", timeout=10)
             if response.status_code != 200:
-                self.logger.error(f"Failed to negotiate: {response.text}")
+                self.logger.error("Failed to negotiate: %s", response.text)
                 return None, None
 
             data = response.json()
             cookies = dict(response.cookies.items())
             return data.get("connectionToken"), cookies
         except Exception as e:
-            self.logger.error(f"Negotiation error: {e}")
+            self.logger.error("Negotiation error: %s", e)
             return None, None
 
+    async def negotiate_async(self) -> tuple[Optional[str], Optional[dict[str, str]]]:
+        # The blocking request runs in a worker thread so the event loop keeps serving
+        # other connections; the pooled session is shared with negotiate().
+        return await asyncio.to_thread(self.negotiate)
+
     async def connect(self, connection_token: str, cookies: Optional[dict[str, str]] = None):
-        ws_url = self.url.replace("http", "ws").replace("https", "wss") + "/hub"
         extra_headers = {}
         if cookies:
-            cookie_header = "; ".join([f"{k}={v}" for k, v in cookies.items()])
-            extra_headers["Cookie"] = cookie_header
+            extra_headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
 
-        import urllib.parse
-
-        encoded_token = urllib.parse.quote(connection_token)
-        full_ws_url = f"{ws_url}?id={encoded_token}"
+        full_ws_url = f"{self._ws_base}?id={urllib.parse.quote(connection_token)}"
 
         try:
             self.websocket = await websockets.connect(full_ws_url, additional_headers=extra_headers)
             self.running = True
+            self._pending = ""
+            self._outbox.clear()
             self.logger.info("WebSocket connected")
 
             # SignalR Handshake
@@ -72,42 +114,134 @@ class VoxtaTransport:
             raise VoxtaConnectionError(f"Failed to connect to {full_ws_url}: {e}") from e
 
     async def send(self, payload: dict[str, Any]):
-        if not self.websocket:
-            self.logger.warning("Attempted to send message but WebSocket is not connected")
+        await self._write(dumps(payload) + "\x1e")
+
+    async def send_record(self, record: str):
+        await self._write(record + "\x1e")
+
+    async def send_many(self, payloads: list[dict[str, Any]]):
+        await self.send_records([dumps(payload) for payload in payloads])
+
+    async def send_records(self, records: list[str]):
+        if not records:
             return
+        # SignalR records are self-delimiting, so several can share one WebSocket message.
+        # Small batches are joined into a single frame; large ones are grouped into
+        # fragments of up to the frame cap so they are written out without one big
+        # concatenated copy.
+        records = [record + "\x1e" for record in records]
+        if sum(map(len, records)) > _FRAGMENT_THRESHOLD:
+            fragments = []
+            start = 0
+            while start < len(records):
+                end = _frame_end(records, start)
+                fragments.append("".join(records[start:end]))
+                start = end
+            await self._write(fragments)
+        else:
+            await self._write("".join(records))
 
-        msg = json.dumps(payload) + "\x1e"
+    async def _write(self, msg: Union[str, list[str]]):
+        if self.websocket is None:
+            raise VoxtaConnectionError("Cannot send: WebSocket is not connected")
+        if self._flush_done is not None:
+            # Another send is awaiting the socket; queue behind it so its writer
+            # coalesces everything that piled up into the next frame, and wait for that
+            # flush so callers get backpressure and see a failed send. Shielded so a
+            # cancelled caller doesn't cancel the shared future.
+            if isinstance(msg, str):
+                self._outbox.append(msg)
+            else:
+                self._outbox.extend(msg)
+            await asyncio.shield(self._flush_done)
+            return
+
+        flush_done = self._flush_done = asyncio.get_running_loop().create_future()
+        queued_error: Optional[VoxtaConnectionError] = None
         try:
-            await self.websocket.send(msg)
+            while True:
+                await self.websocket.send(msg)
+                if not self._outbox:
+                    break
+                msg = self._drain_outbox()
+        except asyncio.CancelledError:
+            # Records queued behind this write were never sent; fail their callers instead
+            # of leaving them in the outbox for some unrelated later send to pick up
+            self._outbox.clear()
+            queued_error = VoxtaConnectionError(
+                "Failed to send queued message: the write ahead of it was cancelled"
+            )
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to send message: {e}")
+            self.logger.error("Failed to send message: %s", e)
             self.running = False
+            self._outbox.clear()
+            queued_error = VoxtaConnectionError(f"Failed to send queued message: {e}")
+            raise VoxtaConnectionError(f"Failed to send message: {e}") from e
+        finally:
+            self._flush_done = None
+            # Only this writer resolves the future, but a stray cancellation must never
+            # turn a send that went through into an InvalidStateError
+            if not flush_done.done():
+                if queued_error is None:
+                    flush_done.set_result(None)
+                else:
+                    flush_done.set_exception(queued_error)
+                    # The writer raises on its own; don't warn when nothing was queued
+                    flush_done.exception()
+
+    def _drain_outbox(self) -> str:
+        # Take queued records up to the frame cap (always at least one) so bursts are
+        # coalesced without building one unbounded frame.
+        count = _frame_end(self._outbox)
+        batch = "".join(self._outbox[:count])
+        del self._outbox[:count]
+        return batch
+
+    def _split_records(self, message: Union[str, bytes]) -> list[Union[str, bytes]]:
+        # Split on the record separator in the frame's own type (text or binary) so
+        # nothing is re-encoded, and keep any unterminated tail for the next frame.
+        separator = b"\x1e" if isinstance(message, bytes) else "\x1e"
+        if self._pending:
+            message = self._pending + message
+        *records, self._pending = message.split(separator)
+        if len(self._pending) > _MAX_PENDING_RECORD:
+            self.logger.error(
+                "Discarding unterminated SignalR record of length %d", len(self._pending)
+            )
+            self._pending = ""
+        return records
 
     async def _read_loop(self):
         try:
             while self.running and self.websocket:
                 try:
                     message = await self.websocket.recv()
-                    raw_messages = message.split("\x1e")
-                    for raw_msg in raw_messages:
-                        if not raw_msg.strip():
+                    for raw_msg in self._split_records(message):
+                        if not raw_msg.strip() or raw_msg in _PING_RECORDS:
                             continue
                         try:
-                            parsed = json.loads(raw_msg)
+                            parsed = loads(raw_msg)
                             if self._on_message_callback:
                                 if asyncio.iscoroutinefunction(self._on_message_callback):
                                     await self._on_message_callback(parsed)
                                 else:
                                     self._on_message_callback(parsed)
-                        except json.JSONDecodeError as e:
-                            self.logger.error(f"Failed to decode SignalR message: {e}")
+                        except DECODE_ERRORS as e:
+                            # %r keeps binary records as bytes, so nothing is decoded here
+                            self.logger.error(
+                                "Failed to decode SignalR record (length %d): %r | %s",
+                                len(raw_msg),
+                                raw_msg[:200],
+                                e,
+                            )
                 except websockets.ConnectionClosed as e:
-                    self.logger.info(f"WebSocket closed: {e.code} ({e.reason})")
+                    self.logger.info("WebSocket closed: %s (%s)", e.code, e.reason)
                     break
                 except asyncio.CancelledError:
                     break
                 except Exception as e:
-                    self.logger.error(f"Error in transport read loop: {e}")
+                    self.logger.error("Error in transport read loop: %s", e)
                     break
         finally:
             self.running = False
@@ -119,6 +253,14 @@ class VoxtaTransport:
 
     async def close(self):
         self.running = False
+        if self._flush_done is not None:
+            # Give the in-flight writer a bounded chance to send everything queued behind
+            # it. Shielded so cancelling close() can't cancel the writer's future, and
+            # bounded because a peer that stopped reading would stall it forever; closing
+            # the socket below is what unblocks such a write.
+            with contextlib.suppress(asyncio.TimeoutError, VoxtaConnectionError):
+                await asyncio.wait_for(asyncio.shield(self._flush_done), _CLOSE_FLUSH_TIMEOUT)
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
+        self._http.close()